@@ -8,13 +8,32 @@ Supports:
 
 import os
 import sys
+import queue
+import atexit
+import asyncio
+import threading
 import logging
+import logging.handlers
 import traceback
+from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from travel_assistant.router import routes_assistant
-from travel_assistant.utils.helpers import format_response
+from fastapi.middleware.gzip import GZipMiddleware
+
+# ------------------ Event Loop ------------------
+# Chosen once per process: the CLI session and the Uvicorn server both run on
+# a single uvloop loop when it is installed (it isn't available on Windows).
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+EVENT_LOOP = "uvloop" if uvloop else "asyncio"
+# uvloop.run arrived in uvloop 0.18; older installs (uvicorn[standard] allows
+# them) run the CLI on the default asyncio loop.
+_run_async = getattr(uvloop, "run", None) or asyncio.run
 
 # ------------------ Logging Setup ------------------
 def _is_writable(path: str) -> bool:
@@ -28,79 +47,170 @@ def _is_writable(path: str) -> bool:
     except Exception:
         return False
 
-# Prefer env, then /app/logs, fall back to /tmp/app-logs, else stdout only
+# Without LOG_DIR: ./backend/logs, then /app/logs, fall back to /tmp/app-logs, else stdout only
 DEFAULT_LOG_DIRS = [
-    os.getenv("LOG_DIR") or "",                    # explicit env
     os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs"),  # ./backend/logs (local dev)
     "/app/logs",                                   # container path (if writable)
     "/var/log/app",                                # if running as root and writable
     "/tmp/app-logs"                                # always writable in containers
 ]
 
-log_dir = None
-for cand in DEFAULT_LOG_DIRS:
-    if not cand:
-        continue
-    if _is_writable(cand):
-        log_dir = cand
-        break
+LOG_FLUSH_INTERVAL = 0.2  # seconds between buffered app.log flushes
 
-handlers = [logging.StreamHandler(sys.stdout)]
-if log_dir:
-    try:
-        handlers.append(logging.FileHandler(os.path.join(log_dir, "app.log")))
-    except Exception:
-        # If file handler fails, we’ll just stream logs.
-        pass
+def _flush_periodically(handler: logging.Handler, interval: float, stop: threading.Event):
+    while not stop.wait(interval):
+        handler.flush()
+
+def _configure_logging() -> Optional[str]:
+    """Install the root QueueHandler and its listener; returns the app.log directory (if any)."""
+    log_dir = None
+    explicit_dir = os.getenv("LOG_DIR")
+    if explicit_dir:
+        # Trust the operator: no write probe (a FileHandler failure still falls back to stdout).
+        try:
+            os.makedirs(explicit_dir, exist_ok=True)
+            log_dir = explicit_dir
+        except OSError:
+            pass
+    if not log_dir:
+        for cand in DEFAULT_LOG_DIRS:
+            if _is_writable(cand):
+                log_dir = cand
+                break
+
+    # Sinks run on the QueueListener thread so request handlers never block on I/O.
+    log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    stream_sink = logging.StreamHandler(sys.stdout)
+    stream_sink.setFormatter(log_formatter)
+    sinks = [stream_sink]
+    if log_dir:
+        try:
+            file_sink = logging.FileHandler(os.path.join(log_dir, "app.log"))
+            file_sink.setFormatter(log_formatter)
+            # Batch file writes; errors still hit the disk immediately.
+            file_buffer = logging.handlers.MemoryHandler(
+                capacity=512, flushLevel=logging.ERROR, target=file_sink
+            )
+            sinks.append(file_buffer)
+            flush_stop = threading.Event()
+            threading.Thread(
+                target=_flush_periodically,
+                args=(file_buffer, LOG_FLUSH_INTERVAL, flush_stop),
+                name="log-flush",
+                daemon=True,
+            ).start()
+            atexit.register(flush_stop.set)
+        except Exception:
+            # If file handler fails, we’ll just stream logs.
+            log_dir = None
+
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "WARNING"),
+        format="%(message)s",  # sinks apply the real format on the listener thread
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+    )
+    log_listener = logging.handlers.QueueListener(log_queue, *sinks, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    return log_dir
 
-logging.basicConfig(
-    level=os.getenv("LOG_LEVEL", "INFO"),
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=handlers,
-)
 logger = logging.getLogger("travel_assistant.main")
-if log_dir:
-    logger.info(f" Logging to {log_dir}/app.log")
-else:
-    logger.info(" File logging disabled (stdout only).")
+DEBUG = os.getenv("DEBUG", "0").lower() in ("1", "true", "yes")
+
+# `python main.py` in server mode, --reload and test runs import this module
+# more than once; only the first import may attach handlers.
+if not logging.getLogger().handlers:
+    log_dir = _configure_logging()
+    if log_dir:
+        logger.info(" Logging to %s/app.log", log_dir)
+    else:
+        logger.info(" File logging disabled (stdout only).")
 
 # ------------------ FASTAPI APP ------------------
-app = FastAPI(title="Travel Assistant API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Deferred so importing main (CLI mode, a preloading Gunicorn master,
+    # tooling) doesn't build the assistant graph: services, responders, HTTP client.
+    from travel_assistant.router import routes_assistant
+    from travel_assistant.utils.http_client import close_http_client
+    # Mounted once per app: a second lifespan run (another TestClient context,
+    # an in-process restart) must not register the routes again.
+    if not getattr(app.state, "routes_mounted", False):
+        app.include_router(routes_assistant.router, prefix="/assistant", tags=["assistant"])
+        app.state.routes_mounted = True
+        logger.debug(" FastAPI app initialized. Router /assistant mounted.")
+    # Load the model in the background; startup (and readiness) doesn't wait on it.
+    app.state.llm_warm_up = asyncio.create_task(routes_assistant.assistant.warm_up())
+    try:
+        yield
+    finally:
+        app.state.llm_warm_up.cancel()
+        await close_http_client()
 
-origins = [
-    os.getenv("FRONTEND_ORIGIN", "http://localhost:3000"),
-    "http://127.0.0.1:3000",
-    os.getenv("ALLOW_ORIGIN_WILDCARD", "*"),
-]
+app = FastAPI(title="Travel Assistant API", default_response_class=ORJSONResponse, lifespan=lifespan)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[o for o in origins if o],  # filter Nones
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+# Explicit allowlist: a "*" origin with credentials forces Starlette to echo
+# the request origin (and add Vary) on every response.
+# CORS_ORIGINS (comma-separated, as docker-compose sets it) replaces the defaults.
+ALLOWED_ORIGINS = tuple(
+    o.strip()
+    for o in (
+        os.getenv("CORS_ORIGINS")
+        or f'{os.getenv("FRONTEND_ORIGIN", "http://localhost:3000")},http://127.0.0.1:3000'
+    ).split(",")
+    if o.strip()
 )
+ALLOWED_METHODS = ("GET", "POST", "OPTIONS")
+ALLOWED_HEADERS = ("Content-Type", "Authorization")
+# Let browsers reuse a preflight for a day instead of re-sending OPTIONS per POST.
+CORS_MAX_AGE = int(os.getenv("CORS_MAX_AGE", "86400"))
 
-app.include_router(routes_assistant.router, prefix="/assistant", tags=["assistant"])
-logger.info(" FastAPI app initialized. Router /assistant mounted.")
+def _install_middleware(app: FastAPI) -> None:
+    """Register all middleware in one place.
+
+    Starlette wraps in reverse order of registration, so the last one added
+    is outermost. Order, outermost first:
+      1. CORS  - answers preflights before anything else runs
+      2. GZip  - compresses only the final response body
+    New middleware goes between the two unless it must see preflights.
+    """
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=list(ALLOWED_ORIGINS),
+        allow_origin_regex=os.getenv("ALLOW_ORIGIN_REGEX"),
+        allow_credentials=True,
+        allow_methods=list(ALLOWED_METHODS),
+        allow_headers=list(ALLOWED_HEADERS),
+        max_age=CORS_MAX_AGE,
+    )
+
+_install_middleware(app)
 
 # ------------------ Global Exception Handler ------------------
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    tb = traceback.format_exc()
-    logger.error(" Unhandled error during request", exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": str(exc),
-            "traceback": tb.splitlines()[-5:],
-            "path": str(request.url),
-        },
-    )
+    logger.error(" Unhandled error during request", exc_info=exc)
+    content = {"error": str(exc), "path": str(request.url)}
+    if DEBUG:
+        # Only pay for traceback formatting when someone will read it, and
+        # format just the innermost frames instead of the whole stack.
+        content["traceback"] = traceback.format_exception(
+            type(exc), exc, exc.__traceback__, limit=-5
+        )
+    return ORJSONResponse(status_code=500, content=content)
 
 # ------------------ CLI MODE (optional local) ------------------
+# ANSI "cursor home + erase display"; avoids forking a shell just to clear.
+_CLEAR = "\x1b[H\x1b[J" if os.name != "nt" else None
+
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _CLEAR:
+        sys.stdout.write(_CLEAR)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
 
 def print_banner():
     banner = """
@@ -109,36 +219,123 @@ def print_banner():
     """
     print(banner)
 
-def run_cli():
+def print_help(assistant):
+    print(
+        "\n Commands:\n"
+        "  help     show this list\n"
+        "  summary  show what I remember about your trip\n"
+        "  clear    clear the screen\n"
+        "  quit     leave (also: exit, bye)"
+    )
+
+def print_summary(assistant):
+    summary = assistant.get_conversation_summary()
+    print(f"\n Topic: {summary.get('current_topic') or '-'}")
+    for key, value in summary.get("context", {}).items():
+        print(f"  {key}: {value}")
+
+def clear_and_banner(assistant):
+    clear_screen()
+    print_banner()
+
+async def ainput(prompt: str = "") -> str:
+    """input() for coroutines: reads on a daemon thread and resolves a future.
+
+    Unlike run_in_executor, the blocked read doesn't pin a default-executor
+    worker (shared with asyncio.to_thread lookups) and doesn't hold up
+    interpreter shutdown after Ctrl+C.
+    """
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+
+    def _resolve(value=None, error=None):
+        if fut.done():
+            return
+        if error is not None:
+            fut.set_exception(error)
+        else:
+            fut.set_result(value)
+
+    def _read():
+        try:
+            result = (input(prompt), None)
+        except BaseException as e:  # EOFError / KeyboardInterrupt
+            result = (None, e)
+        try:
+            loop.call_soon_threadsafe(_resolve, *result)
+        except RuntimeError:
+            pass  # loop already closed: the session ended while we were reading
+
+    threading.Thread(target=_read, name="cli-stdin", daemon=True).start()
+    return await fut
+
+_EXIT = frozenset({"quit", "exit", "bye"})
+_COMMANDS = {
+    "help": print_help,
+    "summary": print_summary,
+    "clear": clear_and_banner,
+}
+
+async def run_cli_async():
     from travel_assistant.core.assistant import TravelAssistant
+    from travel_assistant.utils.helpers import format_response
+    from travel_assistant.utils.http_client import close_http_client
     assistant = TravelAssistant()
 
     clear_screen()
     print_banner()
-    print(" Assistant: Hello! How can I help you with your travel plans today?")
+    print(" Assistant: Hello! How can I help you with your travel plans today? (type 'help' for commands)")
 
     while True:
         try:
-            user_input = input("\n You: ").strip()
+            # Read stdin off-loop so the assistant's HTTP pools stay serviced.
+            user_input = (await ainput("\n You: ")).strip()
             if not user_input:
                 continue
-            if user_input.lower() in ("quit", "exit", "bye"):
+            cmd = user_input.lower()
+            if cmd in _EXIT:
                 print("\n Safe travels!")
                 break
+            handler = _COMMANDS.get(cmd)
+            if handler:
+                handler(assistant)
+                continue
             print("\n Thinking...")
-            resp = asyncio.run(assistant.generate_response(user_input)) 
-            print(f"\n Assistant: {format_response(resp)}")
-        except KeyboardInterrupt:
+            resp = await assistant.generate_response(user_input)
+            print(f"\n Assistant: {format_response(resp.get('answer', ''))}")
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
             print("\n\n Safe travels!")
             break
         except Exception as e:
             logger.exception("CLI error")
             print(f" Error: {e}")
 
+    await close_http_client()
+
+def run_cli():
+    # One loop for the whole session keeps keep-alive connections warm across turns.
+    _run_async(run_cli_async())
+
+def run_server():
+    import uvicorn
+    # Conversation state lives in-process (see routes_assistant), so each worker
+    # keeps its own sessions. Scale out only behind sticky routing.
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop=EVENT_LOOP,
+        http="httptools",
+        log_level=os.getenv("LOG_LEVEL", "warning").lower(),
+    )
+
 if __name__ == "__main__":
-    # Local CLI
-    try:
-        import asyncio
-        run_cli()
-    except Exception as e:
-        logger.exception("Failed to start CLI")
+    if os.getenv("APP_MODE", "cli").lower() == "server":
+        run_server()
+    else:
+        # Local CLI
+        try:
+            run_cli()
+        except Exception as e:
+            logger.exception("Failed to start CLI")
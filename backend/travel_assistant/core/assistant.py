@@ -1,10 +1,16 @@
 # travel_assistant/core/assistant.py
-from typing import Dict, Any, Optional
-import json
+from typing import AsyncIterator, ClassVar, Dict, Any, Mapping, Optional, Tuple
+from collections import OrderedDict
+from types import MappingProxyType
+import functools
+import hashlib
 import logging
 import os
+import re
 import asyncio
 import httpx
+import orjson
+from cachetools import TTLCache
 
 from .prompt_engine import PromptEngine
 from .conversation import ConversationManager, QueryType
@@ -25,7 +31,8 @@ from ..services.country_service import CountryService
 from ..services.hotel_service import HotelService
 from ..services.transport_service import TransportService
 from ..services.visa_service import VisaService
-from ..utils.helpers import geocode_location
+from ..utils.helpers import estimate_days, geocode_location_async
+from ..utils.http_client import get_http_client
 
 # Flow utilities
 from .flow.temporal_resolver import TemporalResolver
@@ -35,66 +42,278 @@ from .intent import TripIntent, AccommodationPrefs
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Prompts mentioning relative time or concrete dates must not be served from cache.
+_VOLATILE_PROMPT = re.compile(r"\b(now|today|tonight|tomorrow|yesterday|this week|\d{4}-\d{2}-\d{2})\b", re.I)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _found_hotels(hotels) -> bool:
+    # HotelService returns a single "error" placeholder when every mirror fails.
+    return bool(hotels) and hotels[0].get("type") != "error"
+
+
+# Transient lookup failures; anything else is a bug and surfaces in generate_response.
+_LOOKUP_ERRORS = (httpx.HTTPError, OSError, KeyError, ValueError)
+
+
+def _norm_key(text: str) -> str:
+    """Cache key for user-typed text: "  New  York" and "new york" share one entry."""
+    return _WHITESPACE.sub(" ", text.strip().lower())
+
 
 class TravelAssistant:
     """Modular travel assistant with responders and layered fallback."""
 
+    # Static across turns; everything per-turn goes in the user message after it.
+    SYSTEM_PROMPT = (
+        "You are a precise travel assistant. Use the normalized plan if available. "
+        "If the destination is missing, clearly ask for it, while keeping all parsed details intact. "
+        "Do not contradict parsed dates, budget, or accommodation."
+    )
+    # Shared by every turn's message list; read-only so no turn can alter it.
+    _SYSTEM_MSG: ClassVar[Mapping[str, str]] = MappingProxyType({"role": "system", "content": SYSTEM_PROMPT})
+
+    # Follow-up questions, keyed by the missing field; built once, read-only.
+    _FOLLOWUPS: ClassVar[Mapping[str, str]] = MappingProxyType({
+        "destination": "What city are you staying in? (e.g., Paris, Bangkok)",
+        "citizenship": "Which passport will you travel with?",
+        "duration": "How long do you plan to stay?",
+        "purpose": "Is the trip for tourism, business, or something else?",
+    })
+    _PLANNING_TYPES: ClassVar[frozenset] = frozenset({QueryType.ITINERARY, QueryType.ACCOMMODATION, QueryType.BUDGET})
+    _VISA_FIELDS: ClassVar[tuple] = ("citizenship", "duration", "purpose")
+
     def __init__(self, model: Optional[str] = None):
         self.llm_api_url = os.getenv("LLM_API_URL", "http://localhost:11434/api/generate")
         # Use env LLM_MODEL if provided, fallback to deepseek
         self.model = model or os.getenv("LLM_MODEL", "deepseek:7b")
+        # Keep the model (and its cached prompt prefix) resident between turns.
+        self.llm_keep_alive = os.getenv("LLM_KEEP_ALIVE", "30m")
+        # Default generation cap (Ollama num_predict); unset leaves the model's own limit.
+        self.llm_num_predict = int(os.getenv("LLM_NUM_PREDICT", "0")) or None
+        # Fail fast if Ollama is down, but give generation time to finish.
+        self.llm_timeout = httpx.Timeout(
+            float(os.getenv("LLM_READ_TIMEOUT", "120")),
+            connect=float(os.getenv("LLM_CONNECT_TIMEOUT", "5")),
+        )
+        # Match Ollama's OLLAMA_NUM_PARALLEL: keeps its slots full while extra
+        # turns wait here, where the wait doesn't count against the read timeout.
+        self._llm_slots = asyncio.Semaphore(int(os.getenv("LLM_MAX_CONCURRENCY", "4")))
 
 
         self.prompt_engine = PromptEngine()
         self.conversation_manager = ConversationManager()
+        self._summary: Optional[Dict[str, Any]] = None
+        self._summary_version = None
 
+        # Ollama and every lookup API share the process-wide connection pool,
+        # fetched per request (get_http_client) so a closed client is replaced.
         self.weather_service = WeatherService()
         self.country_service = CountryService()
         self.hotel_service = HotelService()
         self.transport_service = TransportService()
         self.visa_service = VisaService()
 
-        limits = httpx.Limits(max_keepalive_connections=10, max_connections=20)
-        self._client = httpx.AsyncClient(timeout=20, limits=limits)
+        # LRU of (model, prompt) -> response; skips the Ollama round-trip on repeats.
+        self._llm_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._llm_cache_size = int(os.getenv("LLM_CACHE_SIZE", "512"))
+        self._llm_inflight: Dict[str, "asyncio.Future[str]"] = {}
 
-        # Responder registry
+        # Destination lookups repeat across a conversation; keep them for an hour.
+        lookup_size = int(os.getenv("LOOKUP_CACHE_SIZE", "2048"))
+        lookup_ttl = int(os.getenv("LOOKUP_CACHE_TTL", "3600"))
+        self._geo_cache = TTLCache(maxsize=lookup_size, ttl=lookup_ttl)
+        self._country_cache = TTLCache(maxsize=lookup_size, ttl=lookup_ttl)
+        self._climate_cache = TTLCache(maxsize=lookup_size, ttl=lookup_ttl)
+        self._hotel_cache = TTLCache(maxsize=lookup_size, ttl=lookup_ttl)
+
+
+        # Responder registry; responders are stateless, so one GeneralResponder
+        # serves every type without a dedicated one (and the lookup default).
+        self._general = GeneralResponder()
         self.responders = {
             QueryType.DESTINATION: DestinationResponder(),
             QueryType.PACKING: PackingResponder(),
             QueryType.ATTRACTIONS: AttractionsResponder(),
             QueryType.ACCOMMODATION: AccommodationResponder(),
-            QueryType.WEATHER: GeneralResponder(),
-            QueryType.BEST_TIME: GeneralResponder(),
-            QueryType.BUDGET: GeneralResponder(),
-            QueryType.SAFETY: GeneralResponder(),
+            QueryType.WEATHER: self._general,
+            QueryType.BEST_TIME: self._general,
+            QueryType.BUDGET: self._general,
+            QueryType.SAFETY: self._general,
             QueryType.VISA: VisaResponder(self.visa_service),
             QueryType.ITINERARY: ItineraryResponder(),
-            QueryType.GENERAL: GeneralResponder(),
+            QueryType.GENERAL: self._general,
         }
 
     # ---------------- LLM ----------------
-    async def call_llm(self, messages: list) -> str:
+    def _llm_request(self, messages: list, max_tokens: Optional[int]) -> Tuple[str, str, str, bool]:
+        # System text goes in Ollama's `system` field so every request starts with
+        # the same static prefix and the server can reuse its KV cache for it.
+        system = "\n".join(m["content"] for m in messages if m["role"] == "system")
+        prompt = "\n".join(f"{m['role']}: {m['content']}" for m in messages if m["role"] != "system")
+        cacheable = self._llm_cache_size > 0 and not _VOLATILE_PROMPT.search(prompt)
+        key = hashlib.sha1(f"{self.model}\0{max_tokens}\0{system}\0{prompt}".encode()).hexdigest()
+        return system, prompt, key, cacheable
+
+    def _llm_payload(self, system: str, prompt: str, stream: bool, max_tokens: Optional[int]) -> bytes:
         payload = {
             "model": self.model,
-            "prompt": "\n".join([f"{m['role']}: {m['content']}" for m in messages])
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": self.llm_keep_alive,
         }
+        if system:
+            payload["system"] = system
+        if max_tokens:
+            payload["options"] = {"num_predict": max_tokens}
+        return orjson.dumps(payload)
+
+    def _cached_llm(self, key: str, cacheable: bool) -> Optional[str]:
+        if not cacheable:
+            return None
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            self._llm_cache.move_to_end(key)
+        return cached
+
+    def _remember_llm(self, key: str, answer: str) -> None:
+        self._llm_cache[key] = answer
+        if len(self._llm_cache) > self._llm_cache_size:
+            self._llm_cache.popitem(last=False)
+
+    async def warm_up(self) -> None:
+        """Open the Ollama connection and load the model before the first turn.
+
+        An empty-prompt generate request only loads the model (held for
+        keep_alive). Failures are logged, never raised: a cold first turn is
+        still a working one.
+        """
         try:
-            resp = await self._client.post(self.llm_api_url, json=payload)
+            resp = await get_http_client().post(
+                self.llm_api_url,
+                content=orjson.dumps({"model": self.model, "keep_alive": self.llm_keep_alive}),
+                headers=_JSON_HEADERS,
+                timeout=self.llm_timeout,
+            )
             resp.raise_for_status()
-            return resp.json().get("response", "").strip()
+            logger.info("LLM warm-up done: %s", self.model)
         except Exception as e:
-            logger.error(f"LLM error: {e}")
+            logger.warning("LLM warm-up failed: %s", e)
+
+    async def call_llm(self, messages: list, max_tokens: Optional[int] = None) -> str:
+        """Complete `messages`; `max_tokens` caps generation (default: LLM_NUM_PREDICT)."""
+        max_tokens = max_tokens or self.llm_num_predict
+        system, prompt, key, cacheable = self._llm_request(messages, max_tokens)
+        cached = self._cached_llm(key, cacheable)
+        if cached is not None:
+            return cached
+
+        # Identical prompts already on the wire share one request. The fetch runs
+        # as its own task (shielded) so a cancelled caller can't cancel it for the rest.
+        task = self._llm_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_llm(key, system, prompt, cacheable, max_tokens))
+            self._llm_inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch_llm(self, key: str, system: str, prompt: str, cacheable: bool, max_tokens: Optional[int]) -> str:
+        try:
+            async with self._llm_slots:
+                resp = await get_http_client().post(
+                    self.llm_api_url,
+                    content=self._llm_payload(system, prompt, False, max_tokens),
+                    headers=_JSON_HEADERS,
+                    timeout=self.llm_timeout,
+                )
+            resp.raise_for_status()
+            answer = orjson.loads(resp.content).get("response", "").strip()
+            # Fill the LRU before leaving the in-flight map, so a new caller
+            # always finds the answer in one of the two.
+            if cacheable and answer:
+                self._remember_llm(key, answer)
+            return answer
+        except Exception as e:
+            logger.error("LLM error: %s", e)
             return "__LLM_ERROR__"
+        finally:
+            self._llm_inflight.pop(key, None)
+
+    async def call_llm_stream(self, messages: list, max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        """Yield the LLM answer piece by piece as Ollama generates it.
+
+        A cached answer comes back as a single piece; a completed stream is
+        cached like call_llm's. Errors propagate to the caller.
+        """
+        max_tokens = max_tokens or self.llm_num_predict
+        system, prompt, key, cacheable = self._llm_request(messages, max_tokens)
+        cached = self._cached_llm(key, cacheable)
+        if cached is not None:
+            yield cached
+            return
+
+        parts = []
+        async with self._llm_slots, get_http_client().stream(
+            "POST",
+            self.llm_api_url,
+            content=self._llm_payload(system, prompt, True, max_tokens),
+            headers=_JSON_HEADERS,
+            timeout=self.llm_timeout,
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                piece = chunk.get("response")
+                if piece:
+                    parts.append(piece)
+                    yield piece
+                if chunk.get("done"):
+                    break
+
+        answer = "".join(parts).strip()
+        if cacheable and answer:
+            self._remember_llm(key, answer)
+
+    # ---------------- Lookup Cache ----------------
+    async def _cached(self, cache: TTLCache, key, fn, *args, valid=bool):
+        """Await `fn(*args)`, memoized in `cache`.
+
+        The cache holds the task itself, so concurrent callers for the same key
+        share one request. Failures and results `valid` rejects (by default:
+        empty ones) are dropped once they land.
+        """
+        task = cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args))
+            cache[key] = task
+            task.add_done_callback(functools.partial(self._drop_failed, cache, key, valid))
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _drop_failed(cache: TTLCache, key, valid, task: "asyncio.Future") -> None:
+        if task.cancelled() or task.exception() is not None or not valid(task.result()):
+            if cache.get(key) is task:
+                del cache[key]
 
     # ---------------- Trip Intent Builder ----------------
     def _build_trip_intent(self, user_input: str, entities: Dict[str, Any]) -> TripIntent:
+        # The flow parsers only read keywords and numbers: lowercase once for all.
+        text = user_input.lower()
         # Dates
-        start, end, nights = TemporalResolver.resolve(user_input)
+        start, end, nights = TemporalResolver.resolve(text)
         # Budget
-        unlimited, max_ppn, currency = BudgetInterpreter.parse(user_input)
+        unlimited, max_ppn, currency = BudgetInterpreter.parse(text)
         # Accommodation
-        acc_type = AccommodationPlanner.parse_type(user_input) or entities.get("accommodation_type")
-        vibe = AccommodationPlanner.parse_vibe(user_input) or ("any" if "vibe" in user_input.lower() else None)
+        # The extractor already checked this input against the same lexicon (whole
+        # words, plural s): only re-parse when it found one, for the planner's
+        # precedence and boutique -> hotel mapping.
+        acc_type = entities.get("accommodation_type")
+        if acc_type:
+            acc_type = AccommodationPlanner.parse_type(text) or acc_type
+        vibe = AccommodationPlanner.parse_vibe(text) or ("any" if "vibe" in text else None)
         # Destination
         destination = entities.get("destination")
         # Interests
@@ -121,162 +340,212 @@ class TravelAssistant:
         destination = entities.get("destination")
         results: Dict[str, Any] = {}
 
-        # Pull trip intent if already built
-        ti = self.conversation_manager.context.get("trip_intent")
-
         if destination:
+            dest_key = _norm_key(destination)
             try:
-                coords = await asyncio.to_thread(geocode_location, destination)
-                if coords:
-                    results["coords"] = coords
-                    # Weather (date-aware if supported)
-                    if ti and ti.get("start_date") and ti.get("end_date"):
-                        results["climate_info"] = await asyncio.to_thread(
-                            self.weather_service.get_climate_summary, coords["lat"], coords["lon"]
-                        )
-                    else:
-                        results["climate_info"] = await asyncio.to_thread(
-                            self.weather_service.get_climate_summary, coords["lat"], coords["lon"]
-                        )
-                    # Hotels
-                    results["hotels"] = await asyncio.to_thread(
-                        self.hotel_service.get_hotels_nearby, coords["lat"], coords["lon"]
-                    )
-            except Exception as e:
-                logger.warning(f"Geo/Weather/Hotel failed: {e}")
-
+                coords = await self._cached(self._geo_cache, dest_key, geocode_location_async, get_http_client(), destination)
+            except _LOOKUP_ERRORS as e:
+                logger.warning("Geocoding failed: %r", e)
+                coords = None
+
+            # Everything left is independent: fan out and collect in one gather.
+            # Country info resolves its country from these coordinates rather
+            # than geocoding the destination a second time.
+            jobs = {"country": self._cached(self._country_cache, dest_key, self.country_service.get_country_info_async, destination, coords)}
+            if coords:
+                results["coords"] = coords
+                lat, lon = coords["lat"], coords["lon"]
+                # Nearby points (~1 km) share a climate summary and hotel list.
+                area_key = (round(lat, 2), round(lon, 2))
+                jobs["climate_info"] = self._cached(self._climate_cache, area_key, self.weather_service.get_climate_summary_async, lat, lon)
+                jobs["hotels"] = self._cached(self._hotel_cache, area_key, self.hotel_service.get_hotels_nearby_async, lat, lon, valid=_found_hotels)
+
+            outcomes = await asyncio.gather(*jobs.values(), return_exceptions=True)
+            for name, outcome in zip(jobs, outcomes):
+                if isinstance(outcome, _LOOKUP_ERRORS):
+                    logger.warning("Lookup %s failed: %r", name, outcome)
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                elif outcome:
+                    results[name] = outcome
+
+        # Visa advice (example for Thailand). Pure rule evaluation, no I/O:
+        # cheaper inline than as a thread job in the gather above.
+        if query_type == QueryType.VISA or self.visa_service.is_thailand(destination):
             try:
-                country_info = await asyncio.to_thread(self.country_service.get_country_info, destination)
-                if country_info:
-                    results["country"] = country_info
-            except Exception as e:
-                logger.warning(f"Country info failed: {e}")
-
-        # Visa advice (example for Thailand)
-        try:
-            dest_lower = (destination or "").lower()
-            if query_type == QueryType.VISA or dest_lower in ("thailand", "bangkok", "phuket", "chiang mai"):
-                stay_days = None
-                if entities.get("duration"):
-                    stay_days = self._estimate_days(entities["duration"])
-                advice = self.visa_service.get_thailand_advice(
+                advice = self.visa_service.get_thailand_advice_cached(
                     passport_country=entities.get("citizenship"),
-                    stay_length_days=stay_days,
+                    stay_length_days=estimate_days(entities.get("duration")),
                     purpose=(entities.get("purpose") or "tourism"),
                 )
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning("Visa lookup failed: %r", e)
+            else:
                 results["visa_th"] = advice
-        except Exception as e:
-            logger.warning(f"Visa lookup failed: {e}")
 
         return results
 
-    def _estimate_days(self, duration: str) -> Optional[int]:
-        try:
-            d = duration.lower()
-            if "day" in d:
-                for tok in d.replace("-", " ").split():
-                    if tok.isdigit():
-                        return int(tok)
-            if "week" in d:
-                for tok in d.replace("-", " ").split():
-                    if tok.isdigit():
-                        return int(tok) * 7
-        except Exception:
-            pass
+    # ---------------- Follow-up ----------------
+    def _directed_followup(self, query_type: QueryType, entities: Dict[str, Any]) -> Optional[str]:
+        """Ask for the single most important piece of missing information, if any."""
+        if query_type == QueryType.VISA:
+            for field in self._VISA_FIELDS:
+                if not entities.get(field):
+                    return self._FOLLOWUPS[field]
+            return None
+        if query_type in self._PLANNING_TYPES:
+            if not self.conversation_manager.context.get("trip_intent", {}).get("destination"):
+                return self._FOLLOWUPS["destination"]
         return None
 
     # ---------------- Main ----------------
+    async def _prepare_turn(self, user_input: str) -> Tuple[Optional[str], Dict[str, Any], str, Optional[list]]:
+        """Steps 1-3 of a turn; returns (followup, external, heuristic_answer, llm_messages).
+
+        llm_messages is None when the heuristic answer is final as-is.
+        """
+        # 1) Classify + extract
+        query_type = self.conversation_manager.classify_query(user_input)
+        entities = self.conversation_manager.extract_entities(user_input)
+
+        # 1.5) Normalize declarative trip intent
+        if query_type in self._PLANNING_TYPES:
+            ti = self._build_trip_intent(user_input, entities)
+            self.conversation_manager.set_context("trip_intent", ti.as_context())
+            # Mirror important fields into context
+            if ti.start_date and ti.end_date:
+                self.conversation_manager.set_context("travel_dates", {
+                    "start_date": ti.start_date.isoformat(),
+                    "end_date": ti.end_date.isoformat(),
+                    "nights": ti.nights,
+                })
+            if ti.accommodation.type:
+                self.conversation_manager.set_context("accommodation_type", ti.accommodation.type)
+            if ti.accommodation.budget_unlimited:
+                self.conversation_manager.set_context("budget", "unlimited")
+
+        self.conversation_manager.update_context(user_input, query_type, entities)
+        # Follow-up depends only on parsed input, never on the answer: settle it
+        # before any I/O so nothing after the lookups waits on it.
+        followup = self._directed_followup(query_type, entities)
+
+        # 2) External lookups
+        external = await self._orchestrate_targeted_queries(query_type, entities)
+
+        # 3) Heuristic responder. Runs before the LLM, not beside it: the draft is
+        # the LLM's input, and responders are pure formatting over `external`.
+        responder = self.responders.get(query_type, self._general)
+        heuristic_answer = await responder.respond(entities, external, self.conversation_manager.context)
+
+        if self._heuristic_is_final(query_type, followup, external):
+            logger.debug("LLM skipped: heuristic answer is final for %s", query_type.value)
+            return followup, external, heuristic_answer, None
+
+        # The plan goes in as JSON (orjson, no Python repr walk) so the model
+        # reads null/true rather than None/True.
+        plan = orjson.dumps(self.conversation_manager.context.get("trip_intent")).decode()
+        messages = [
+            self._SYSTEM_MSG,
+            {
+                "role": "user",
+                "content": f"Plan: {plan}\n"
+                           f"Answer draft:\n{heuristic_answer}"
+            },
+        ]
+        return followup, external, heuristic_answer, messages
+
+    def _heuristic_is_final(self, query_type: QueryType, followup: Optional[str], external: Dict[str, Any]) -> bool:
+        # Complete visa guidance (passport, stay and purpose known, advice computed)
+        # is rule output: an LLM rewrite only adds latency and room to misstate rules.
+        return query_type == QueryType.VISA and followup is None and bool(external.get("visa_th"))
+
+    def _finish_turn(self, user_input: str, answer: str, followup: Optional[str], external: Dict[str, Any]) -> Dict[str, Any]:
+        # 5) Save conversation history
+        self.prompt_engine.add_to_history("user", user_input)
+        self.prompt_engine.add_to_history("assistant", answer)
+
+        return AssistantResponse(
+            answer=answer,
+            followup=followup,
+            context=self.get_conversation_summary(),
+            confidence=0.95,
+            sources=list(external.keys()),
+        ).to_dict()
+
+    def _error_response(self) -> Dict[str, Any]:
+        return AssistantResponse(
+            answer="⚠️ Sorry, I hit an error while generating your response.",
+            followup="Can you rephrase or ask a simpler question?",
+            context=self.get_conversation_summary(),
+            confidence=0.2,
+        ).to_dict()
+
     async def generate_response(self, user_input: str) -> Dict[str, Any]:
         try:
-            # 1) Classify + extract
-            query_type = self.conversation_manager.classify_query(user_input)
-            entities = self.conversation_manager.extract_entities(user_input)
-
-            # 1.5) Normalize declarative trip intent
-            if query_type in (QueryType.ITINERARY, QueryType.ACCOMMODATION, QueryType.BUDGET):
-                ti = self._build_trip_intent(user_input, entities)
-                self.conversation_manager.context["trip_intent"] = ti.as_context()
-                # Mirror important fields into context
-                if ti.start_date and ti.end_date:
-                    self.conversation_manager.context["travel_dates"] = {
-                        "start_date": ti.start_date.isoformat(),
-                        "end_date": ti.end_date.isoformat(),
-                        "nights": ti.nights,
-                    }
-                if ti.accommodation.type:
-                    self.conversation_manager.context["accommodation_type"] = ti.accommodation.type
-                if ti.accommodation.budget_unlimited:
-                    self.conversation_manager.context["budget"] = "unlimited"
-
-            self.conversation_manager.update_context(user_input, query_type, entities)
-
-            # 2) External lookups
-            external = await self._orchestrate_targeted_queries(query_type, entities)
-
-            # 3) Heuristic responder
-            responder = self.responders.get(query_type, GeneralResponder())
-            heuristic_answer = await responder.respond(entities, external, self.conversation_manager.context)
-
-            # 4) LLM enrichment
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a precise travel assistant. Use the normalized plan if available. "
-                               "If the destination is missing, clearly ask for it, while keeping all parsed details intact. "
-                               "Do not contradict parsed dates, budget, or accommodation."
-                },
-                {
-                    "role": "user",
-                    "content": f"Plan: {self.conversation_manager.context.get('trip_intent')}\n"
-                               f"Answer draft:\n{heuristic_answer}"
-                },
-            ]
-            llm_answer = await self.call_llm(messages)
-            answer = llm_answer if llm_answer and not llm_answer.startswith("__LLM_") else heuristic_answer
-
-            # 5) Directed follow-up if critical info is missing
-            followup = None
-            ti_ctx = self.conversation_manager.context.get("trip_intent", {})
-            if query_type in (QueryType.ITINERARY, QueryType.ACCOMMODATION, QueryType.BUDGET) and not ti_ctx.get("destination"):
-                followup = "What city are you staying in? (e.g., Paris, Bangkok)"
-
-            if query_type == QueryType.VISA:
-                if not entities.get("citizenship"):
-                    followup = "Which passport will you travel with?"
-                elif not entities.get("duration"):
-                    followup = "How long do you plan to stay?"
-                elif not entities.get("purpose"):
-                    followup = "Is the trip for tourism, business, or something else?"
-
-            # 6) Save conversation history
-            self.prompt_engine.add_to_history("user", user_input)
-            self.prompt_engine.add_to_history("assistant", answer)
-
-            return AssistantResponse(
-                answer=answer,
-                followup=followup,
-                context=self.get_conversation_summary(),
-                confidence=0.95,
-                sources=list(external.keys()),
-            ).__dict__
+            followup, external, heuristic_answer, messages = await self._prepare_turn(user_input)
+
+            # 4) LLM enrichment: the turn's only model call (the follow-up is heuristic)
+            answer = heuristic_answer
+            if messages is not None:
+                llm_answer = await self.call_llm(messages)
+                if llm_answer and not llm_answer.startswith("__LLM_"):
+                    answer = llm_answer
+
+            return self._finish_turn(user_input, answer, followup, external)
+
+        except Exception as e:
+            logger.error("generate_response failed: %s", e, exc_info=True)
+            return self._error_response()
+
+    async def generate_response_stream(self, user_input: str) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming generate_response.
+
+        Yields {"delta": str} events while the LLM writes, then one final event
+        shaped like generate_response's result. If the LLM fails mid-stream the
+        final answer falls back to the heuristic draft, so clients should
+        replace the streamed text with it.
+        """
+        try:
+            followup, external, heuristic_answer, messages = await self._prepare_turn(user_input)
+        except Exception as e:
+            logger.error("generate_response_stream failed: %s", e, exc_info=True)
+            yield self._error_response()
+            return
 
+        if messages is None:
+            yield self._finish_turn(user_input, heuristic_answer, followup, external)
+            return
+
+        # 4) LLM enrichment, forwarded as it arrives
+        parts = []
+        try:
+            async for piece in self.call_llm_stream(messages):
+                parts.append(piece)
+                yield {"delta": piece}
+            answer = "".join(parts).strip() or heuristic_answer
         except Exception as e:
-            logger.error(f"generate_response failed: {e}", exc_info=True)
-            return AssistantResponse(
-                answer="⚠️ Sorry, I hit an error while generating your response.",
-                followup="Can you rephrase or ask a simpler question?",
-                context=self.get_conversation_summary(),
-                confidence=0.2,
-            ).__dict__
+            logger.error("LLM stream error: %s", e)
+            answer = heuristic_answer
+
+        yield self._finish_turn(user_input, answer, followup, external)
 
     def get_conversation_summary(self) -> Dict[str, Any]:
-        from .conversation import QueryType as QT
-        safe_ctx = {
-            k: (v.value if isinstance(v, QT) else v)
-            for k, v in self.conversation_manager.context.items()
-        }
+        # Rebuilt only when the context or history changed since the last call.
+        version = (self.conversation_manager.version, self.prompt_engine.version)
+        if self._summary is None or self._summary_version != version:
+            self._summary = self._build_summary()
+            self._summary_version = version
+        # Each caller gets its own outer and context dicts, so adding or replacing
+        # keys in a response never reaches the cache. Nested values (trip_intent,
+        # travel_dates) are shared with the live context: treat them as read-only.
+        summary = dict(self._summary)
+        summary["context"] = dict(summary["context"])
+        return summary
+
+    def _build_summary(self) -> Dict[str, Any]:
         return {
-            "context": safe_ctx,
+            # Kept JSON-safe at write time
+            "context": dict(self.conversation_manager.safe_context),
             "recent_history": self.prompt_engine.get_recent_history(),
             "current_topic": (
                 self.conversation_manager.current_topic.value
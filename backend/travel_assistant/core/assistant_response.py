@@ -1,11 +1,21 @@
 # travel_assistant/core/assistant_response.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 
-@dataclass
+@dataclass(slots=True)
 class AssistantResponse:
     answer: str
     followup: Optional[str]
     context: Dict[str, Any]
     confidence: float = 0.8
-    sources: List[str] = None
+    sources: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Shallow on purpose: dataclasses.asdict would deep-copy the context.
+        return {
+            "answer": self.answer,
+            "followup": self.followup,
+            "context": self.context,
+            "confidence": self.confidence,
+            "sources": self.sources,
+        }
@@ -3,6 +3,14 @@ from typing import Dict, Any, Optional, List
 from enum import Enum
 import re
 import logging
+import functools
+
+# The classifier alternations chain unbounded .* and run on raw user text:
+# RE2 matches them in linear time. Optional (no wheel on some platforms).
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +27,14 @@ class QueryType(Enum):
     ITINERARY = "itinerary"                  
     GENERAL = "general"
 
+# Every pattern is compiled once here; the per-turn paths only call .search.
+
 # Proper nouns like "New York", "San Francisco"
-_PROPER_NOUN = r"\b([A-Z][a-zA-Z]{2,}(?:[\s\-][A-Z][a-zA-Z]{2,})*)\b"
+_PROPER_NOUN_RE = re.compile(r"\b([A-Z][a-zA-Z]{2,}(?:[\s\-][A-Z][a-zA-Z]{2,})*)\b")
 # Hints like "in Paris", "to London"
-_CITY_HINT = r"(?:\bin|\bto|\bfor|\bat)\s+([A-Z][a-zA-Z]{2,}(?:[\s\-][A-Z][a-zA-Z]{2,})*)"
+_CITY_HINT_RE = re.compile(r"(?:\bin|\bto|\bfor|\bat)\s+([A-Z][a-zA-Z]{2,}(?:[\s\-][A-Z][a-zA-Z]{2,})*)")
 
-_QUESTION_WORDS = {"which", "where", "what", "when", "how", "who", "whom", "whose"}
+_QUESTION_WORDS = frozenset({"which", "where", "what", "when", "how", "who", "whom", "whose"})
 
 _WORD_DURATION = {
     "weekend": "2 days (weekend)",
@@ -33,239 +43,312 @@ _WORD_DURATION = {
     "fortnight": "2 weeks",
 }
 
+# ---- classification (matched against lowercased input) ----
+# Substring keywords, in rule priority order. One scan finds them all: the
+# zero-width lookahead reports every start position (so overlapping keywords
+# still count), and at a shared position the higher-priority category wins,
+# which is the one classification would return first anyway.
+_KEYWORDS = {
+    QueryType.WEATHER: ("weather", "climate", "temperature", "season"),
+    QueryType.VISA: (
+        "visa", "e-visa", "evisa", "visa on arrival", "voa",
+        "entry requirement", "entry requirements", "passport requirement",
+        "immigration", "border", "permission to stay"
+    ),
+    QueryType.BUDGET: ("budget", "how much", "cost", "spend", "price per day", "per day", "per week"),
+    QueryType.BEST_TIME: ("best time", "when to visit", "season to go", "surf", "surfing", "waves", "swell"),
+    QueryType.SAFETY: (
+        "safety", "safe to travel", "is it safe", "solo travel", "solo female",
+        "women safety", "harassment", "scam", "pickpocket", "crime", "emergency"
+    ),
+}
+_KEYWORD_RE = re.compile("(?=" + "|".join(
+    rf"(?P<{qt.value}>{'|'.join(map(re.escape, kws))})" for qt, kws in _KEYWORDS.items()
+) + ")")
+
+def _any_of(patterns):
+    """One alternation per category: a single engine pass instead of a Python loop.
+
+    Only RE2-compatible syntax here: no lookarounds, no backreferences.
+    """
+    return (re2 or re).compile("|".join(f"(?:{p})" for p in patterns))
+
+# Single-word rules are a word-set lookup (\w+ runs == \b...\b); only phrases
+# and the .* rules go to the regex engine. "boutique hotel" is covered by "hotel".
+_HOTEL_WORDS = frozenset({
+    "hotel", "hotels", "hostel", "hostels", "guesthouse", "guesthouses",
+    "accommodation", "lodging", "inn", "motel", "motels", "bnb",
+})
+
+_DESTINATION_PATTERNS = (
+    r"where.*(should|to).*(go|travel)", r"recommend.*destination",
+    r"place.*visit", r"vacation.*ideas", r"trip.*suggestions"
+)
+
+_PACKING_PATTERNS = (
+    r"\bpack\b.*\bwhat\b", r"\bwhat\b.*\bpack\b",
+    r"\bbring\b.*\btrip\b", r"\bwhat\b.*\bwear\b", r"\bessentials\b.*\bbring\b"
+)
+
+_ATTRACTIONS_WORDS = frozenset({"attraction", "attractions", "sightseeing", "activities"})
+_ATTRACTIONS_PATTERNS = (
+    r"\bthings\b.*\bdo\b", r"\bplaces\b.*\bsee\b", r"\bwhat\b.*\bdo\b.*\bin\b"
+)
+
+# Word -> category for the word rules above: one probe per input word. The
+# categories are still tested in rule order, so this only replaces set checks.
+_KEYWORD_TO_TYPE = {
+    **dict.fromkeys(_HOTEL_WORDS, QueryType.ACCOMMODATION),
+    **dict.fromkeys(_ATTRACTIONS_WORDS, QueryType.ATTRACTIONS),
+}
+
+# Fixed multi-word phrases, all categories in one scan; each category is a named
+# group so a hit reports its type. Add phrases here rather than to the .* rules.
+_PHRASES = {
+    QueryType.ACCOMMODATION: ("where to stay", "place to (?:sleep|stay)", "bed and breakfast"),
+    QueryType.PACKING: ("packing list",),
+}
+_PHRASE_RE = re.compile("|".join(
+    rf"(?P<{qt.value}>\b(?:{'|'.join(phrases)})\b)" for qt, phrases in _PHRASES.items()
+))
+
+_DESTINATION_RE = _any_of(_DESTINATION_PATTERNS)
+_PACKING_RE = _any_of(_PACKING_PATTERNS)
+_ATTRACTIONS_RE = _any_of(_ATTRACTIONS_PATTERNS)
+
+# ---- entities ----
+# Patterns whose matched text is stored (duration, budget, citizenship) keep re.I
+# and run on the original text; pure membership tests run on the lowered copy.
+_DURATION_RE = re.compile(r"(\d+)[\s-]*(days?|weeks?|months?)", re.I)
+# All duration words/phrases in one scan of the lowered text; ties go to
+# _WORD_DURATION order, not position in the text.
+_WORD_DURATION_RE = re.compile(r"\b(" + "|".join(map(re.escape, _WORD_DURATION)) + r")\b")
+# Runs only on digit-bearing, whitespace-normalized text (see _extract), which
+# bounds the \s* retries; the amount has a single branch so a failed tail never
+# re-enters the digits through an equivalent alternative.
+_BUDGET_RE = re.compile(
+    r"(?:(?:budget|up to|around)\s*)?([$€£])?\s*(\d+(?:,\d{3})*)"
+    r"(?:\s*(k|thousand))?\s*(usd|dollars|eur|euros|gbp|pounds|per night|/night|a night)?",
+    re.I,
+)
+_INTERESTS = (
+    "beach", "mountain", "city", "culture", "adventure", "food",
+    "shopping", "nature", "museum", "nightlife", "family", "romantic",
+    "dinner", "formal", "hiking"
+)
+_ACC_TYPES = ("hotel", "hostel", "apartment", "boutique", "guesthouse", "bnb", "motel", "resort")
+# Keyword entities are plain words: intersect them with the input's word set
+# (\w+ runs, i.e. exactly what \b...\b would match). Results keep tuple order.
+_WORD_RE = re.compile(r"\w+")
+_INTEREST_SET = frozenset(_INTERESTS)
+_ACC_WORDS = {**{t: t for t in _ACC_TYPES}, **{t + "s": t for t in _ACC_TYPES}}
+# e.g., "US passport", "Indian passport", "I have a Canadian passport", "I'm a German citizen"
+_PASSPORT_RE = re.compile(r"\b([A-Z][a-zA-Z]+)\s+passport\b")
+_CITIZEN_RE = re.compile(r"\b(i am|i'm|im)\s+a\s+([A-Z][a-zA-Z]+)\s+(citizen|national)\b", re.I)
+# Duration and budget both need a digit: one scan rules them out for most turns.
+_DIGIT_RE = re.compile(r"\d")
+
+# Entities carried over from earlier turns when this turn doesn't mention them.
+_REUSED_KEYS = ("destination", "duration", "budget", "citizenship", "purpose", "interests")
+
+# The only context keys that can hold a QueryType; every other value is stored as-is.
+ENUM_KEYS = frozenset(("current_topic", "previous_topic"))
+
+# ---------------- Pure parsing (memoized) ----------------
+# Classification and extraction depend only on the text, and short replies
+# ("yes", "more hotels") repeat a lot; ConversationManager layers context on top.
+@functools.lru_cache(maxsize=2048)
+def _classify(text: str) -> QueryType:
+    """Classify already-lowercased input (the cache key is the lowered text)."""
+    if any(k in text for k in ["staying for", "i am staying", "for  "]) and \
+       any(k in text for k in ["in ", "from now", "days", "weeks"]) and \
+       any(k in text for k in ["hotel", "stay at a"]):
+        return QueryType.ITINERARY
+
+    found = {QueryType(m.lastgroup) for m in _KEYWORD_RE.finditer(text)}
+    if QueryType.WEATHER in found:
+        return QueryType.WEATHER
+    if QueryType.VISA in found:
+        return QueryType.VISA
+
+    hinted = {_KEYWORD_TO_TYPE[w] for w in _WORD_RE.findall(text) if w in _KEYWORD_TO_TYPE}
+    hinted.update(QueryType(m.lastgroup) for m in _PHRASE_RE.finditer(text))
+    if QueryType.ACCOMMODATION in hinted:
+        return QueryType.ACCOMMODATION
+    if _DESTINATION_RE.search(text):
+        return QueryType.DESTINATION
+    if QueryType.PACKING in hinted or _PACKING_RE.search(text):
+        return QueryType.PACKING
+    if QueryType.ATTRACTIONS in hinted or _ATTRACTIONS_RE.search(text):
+        return QueryType.ATTRACTIONS
+
+    for query_type in (QueryType.BUDGET, QueryType.BEST_TIME, QueryType.SAFETY):
+        if query_type in found:
+            return query_type
+
+    return QueryType.GENERAL
+
+
+def _strip_leading_question_words(text: str) -> str:
+    tokens = text.split()
+    i, n = 0, len(tokens)
+    while i < n and tokens[i].lower().strip(",.?") in _QUESTION_WORDS:
+        i += 1
+    # Always re-joined: later patterns expect single spaces between words.
+    return " ".join(tokens[i:] if i else tokens)
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract(user_input: str) -> Dict[str, Any]:
+    """Entities found in the text itself; callers must copy before mutating."""
+    entities = {
+        "destination": None,
+        "duration": None,
+        "budget": None,
+        "interests": [],
+        "travel_dates": None,
+        "accommodation_type": None,
+        "citizenship": None,     
+        "purpose": None,         
+    }
+
+    cleaned = _strip_leading_question_words(user_input)
+    lowered = cleaned.lower()
+    words = frozenset(_WORD_RE.findall(lowered))
+
+    has_digit = _DIGIT_RE.search(cleaned) is not None
+
+    # --- Duration ---
+    if has_digit and (m := _DURATION_RE.search(cleaned)):
+        entities["duration"] = m.group(0).replace("-", " ")
+    elif found := set(_WORD_DURATION_RE.findall(lowered)):
+        entities["duration"] = next(norm for phrase, norm in _WORD_DURATION.items() if phrase in found)
+
+    # --- Budget ---
+    if has_digit and (mb := _BUDGET_RE.search(cleaned)):
+        entities["budget"] = mb.group(0)
+
+    # --- Interests ---
+    if found := words & _INTEREST_SET:
+        entities["interests"] = [w for w in _INTERESTS if w in found]
+
+    # --- Accommodation type ---
+    if found := {_ACC_WORDS[w] for w in words & _ACC_WORDS.keys()}:
+        entities["accommodation_type"] = next(t for t in _ACC_TYPES if t in found)
+
+    # --- Destination ---
+    # Both patterns need a capital letter; all-lowercase input can't have one.
+    if lowered != cleaned:
+        md = _CITY_HINT_RE.search(cleaned)
+        if md:
+            entities["destination"] = md.group(1)
+        else:
+            # Only the last capitalized phrase is used: walk the matches, keep none.
+            last = None
+            for last in _PROPER_NOUN_RE.finditer(cleaned):
+                pass
+            if last:
+                entities["destination"] = last.group(1)
+
+    # --- Citizenship / Passport country ---
+    if m := _PASSPORT_RE.search(user_input):
+        entities["citizenship"] = m.group(1)
+    elif m := _CITIZEN_RE.search(user_input):
+        entities["citizenship"] = m.group(2)
+
+    # --- Purpose ---
+    t = lowered
+    if any(w in t for w in ["tourism", "vacation", "holiday", "leisure"]):
+        entities["purpose"] = "tourism"
+    elif any(w in t for w in ["business", "meeting", "conference"]):
+        entities["purpose"] = "business"
+    elif any(w in t for w in ["study", "student"]):
+        entities["purpose"] = "study"
+    elif any(w in t for w in ["work", "job", "employment"]):
+        entities["purpose"] = "work"
+
+    return entities
+
+
 class ConversationManager:
     """Manages conversation flow and context (stateful)."""
 
+    __slots__ = ("context", "safe_context", "version", "current_topic", "history")
+
     def __init__(self):
         self.context: Dict[str, Any] = {}
+        # JSON-safe mirror of `context` (enums as values), kept in step by set_context
+        self.safe_context: Dict[str, Any] = {}
+        # Bumped on every context/topic change so readers can cache derived views
+        self.version = 0
         self.current_topic: Optional[QueryType] = None
         self.history: List[Dict[str, Any]] = []
         logger.info("ConversationManager initialized")
-        print("[conversation] ConversationManager initialized")
 
     # ---------------- Classification ----------------
     def classify_query(self, user_input: str) -> QueryType:
-        logger.info(f"Classifying query: {user_input}")
-        print(f"[conversation] Classifying: {user_input}")
-
-        text = user_input.lower()
-        if any(k in text for k in ["staying for", "i am staying", "for  "]) and \
-           any(k in text for k in ["in ", "from now", "days", "weeks"]) and \
-           any(k in text for k in ["hotel", "stay at a"]):
-            return QueryType.ITINERARY
-
-        hotel_patterns = [
-            r"\bhotel(s)?\b", r"\bhostel(s)?\b", r"\bguesthouse(s)?\b",
-            r"\b(accommodation|lodging)\b", r"\bwhere to stay\b",
-            r"\bplace to (sleep|stay)\b", r"\binn\b", r"\bmotel(s)?\b",
-            r"\bbnb\b", r"\bbed and breakfast\b", r"\bboutique hotel\b"
-        ]
-        destination_patterns = [
-            r"where.*(should|to).*(go|travel)", r"recommend.*destination",
-            r"place.*visit", r"vacation.*ideas", r"trip.*suggestions"
-        ]
-        packing_patterns = [
-            r"\bpack\b.*\bwhat\b", r"\bwhat\b.*\bpack\b", r"\bpacking list\b",
-            r"\bbring\b.*\btrip\b", r"\bwhat\b.*\bwear\b", r"\bessentials\b.*\bbring\b"
-        ]
-        attractions_patterns = [
-            r"\bthings\b.*\bdo\b", r"\battraction(s)?\b", r"\bsightseeing\b",
-            r"\bplaces\b.*\bsee\b", r"\bactivities\b", r"\bwhat\b.*\bdo\b.*\bin\b"
-        ]
-
-        # Weather
-        if "weather" in text or "climate" in text or "temperature" in text or "season" in text:
-            logger.info("Classified as WEATHER")
-            print("[conversation] Classified as WEATHER")
-            return QueryType.WEATHER
-
-        # Visa / entry requirements
-        if any(k in text for k in [
-            "visa", "e-visa", "evisa", "visa on arrival", "voa",
-            "entry requirement", "entry requirements", "passport requirement",
-            "immigration", "border", "permission to stay"
-        ]):
-            logger.info("Classified as VISA")
-            print("[conversation] Classified as VISA")
-            return QueryType.VISA
-
-        if any(re.search(p, text) for p in hotel_patterns):
-            logger.info("Classified as ACCOMMODATION")
-            print("[conversation] Classified as ACCOMMODATION")
-            return QueryType.ACCOMMODATION
-        if any(re.search(p, text) for p in destination_patterns):
-            logger.info("Classified as DESTINATION")
-            print("[conversation] Classified as DESTINATION")
-            return QueryType.DESTINATION
-        if any(re.search(p, text) for p in packing_patterns):
-            logger.info("Classified as PACKING")
-            print("[conversation] Classified as PACKING")
-            return QueryType.PACKING
-        if any(re.search(p, text) for p in attractions_patterns):
-            logger.info("Classified as ATTRACTIONS")
-            print("[conversation] Classified as ATTRACTIONS")
-            return QueryType.ATTRACTIONS
-
-        if any(k in text for k in ["budget", "how much", "cost", "spend", "price per day", "per day", "per week"]):
-            return QueryType.BUDGET
-
-        if any(k in text for k in ["best time", "when to visit", "season to go", "surf", "surfing", "waves", "swell"]):
-            return QueryType.BEST_TIME
-
-        if any(k in text for k in [
-            "safety", "safe to travel", "is it safe", "solo travel", "solo female",
-            "women safety", "harassment", "scam", "pickpocket", "crime", "emergency"
-        ]):
-            return QueryType.SAFETY
-
-        logger.info("Classified as GENERAL")
-        print("[conversation] Classified as GENERAL")
-        return QueryType.GENERAL
+        # Keyed on the lowered text: "Hotels in Paris" and "hotels in paris" share
+        # an entry. Whitespace is kept as-is; some rules ("for  ", "in ") read it.
+        query_type = _classify(user_input.lower())
+        logger.debug("Classified %r as %s", user_input, query_type.name)
+        return query_type
 
     # ---------------- Entity Extraction ----------------
-    def _strip_leading_question_words(self, text: str) -> str:
-        tokens = [t for t in re.split(r"\s+", text) if t]
-        while tokens and tokens[0].lower().strip(",.?") in _QUESTION_WORDS:
-            tokens.pop(0)
-        return " ".join(tokens)
-
     def extract_entities(self, user_input: str) -> Dict[str, Any]:
-        """Extract key entities from user input with context continuity."""
-        logger.info(f"Extracting entities from: {user_input}")
-        print(f"[conversation] Extracting entities from: {user_input}")
-
-        entities = {
-            "destination": None,
-            "duration": None,
-            "budget": None,
-            "interests": [],
-            "travel_dates": None,
-            "accommodation_type": None,
-            "citizenship": None,     
-            "purpose": None,         
-        }
-
-        cleaned = self._strip_leading_question_words(user_input)
-
-        # --- Duration ---
-        if m := re.search(r"(\d+)[\s-]*(days?|weeks?|months?)", cleaned, flags=re.I):
-            entities["duration"] = m.group(0).replace("-", " ")
-            print(f"[conversation] Duration: {entities['duration']}")
-        else:
-            for phrase, norm in _WORD_DURATION.items():
-                if re.search(rf"\b{phrase}\b", cleaned, flags=re.I):
-                    entities["duration"] = norm
-                    print(f"[conversation] Duration: {entities['duration']}")
-                    break
-
-        # --- Budget ---
-        mb = re.search(
-            r"(?:(?:budget|up to|around)\s*)?(\$|€|£)?\s*(\d+(?:,\d{3})*|\d+)"
-            r"(?:\s*(k|thousand))?\s*(usd|dollars|eur|euros|gbp|pounds|per night|/night|a night)?",
-            cleaned, flags=re.I
-        )
-        if mb:
-            entities["budget"] = mb.group(0)
-            print(f"[conversation] Budget: {entities['budget']}")
-
-        # --- Interests ---
-        interests = [
-            "beach", "mountain", "city", "culture", "adventure", "food",
-            "shopping", "nature", "museum", "nightlife", "family", "romantic",
-            "dinner", "formal", "hiking"
-        ]
-        entities["interests"] = [w for w in interests if re.search(rf"\b{w}\b", cleaned, flags=re.I)]
-        if entities["interests"]:
-            print(f"[conversation] Interests: {entities['interests']}")
-
-        # --- Accommodation type ---
-        acc_types = ["hotel", "hostel", "apartment", "boutique", "guesthouse", "bnb", "motel", "resort"]
-        for t in acc_types:
-            if re.search(rf"\b{t}s?\b", cleaned, re.I):
-                entities["accommodation_type"] = t
-                break
-
-        # --- Destination ---
-        md = re.search(_CITY_HINT, cleaned)
-        if md:
-            entities["destination"] = md.group(1)
-            print(f"[conversation] Destination: {entities['destination']}")
-        else:
-            tokens = re.findall(_PROPER_NOUN, cleaned)
-            if tokens:
-                entities["destination"] = tokens[-1]
-                print(f"[conversation] Destination fallback: {entities['destination']}")
-
-        # --- Citizenship / Passport country ---
-        # e.g., "US passport", "Indian passport", "I have a Canadian passport", "I'm a German citizen"
-        if m := re.search(r"\b([A-Z][a-zA-Z]+)\s+passport\b", user_input):
-            entities["citizenship"] = m.group(1)
-        elif m := re.search(r"\b(i am|i'm|im)\s+a\s+([A-Z][a-zA-Z]+)\s+(citizen|national)\b", user_input, flags=re.I):
-            entities["citizenship"] = m.group(2)
-        if entities.get("citizenship"):
-            print(f"[conversation] Citizenship: {entities['citizenship']}")
-
-        # --- Purpose ---
-        t = cleaned.lower()
-        if any(w in t for w in ["tourism", "vacation", "holiday", "leisure"]):
-            entities["purpose"] = "tourism"
-        elif any(w in t for w in ["business", "meeting", "conference"]):
-            entities["purpose"] = "business"
-        elif any(w in t for w in ["study", "student"]):
-            entities["purpose"] = "study"
-        elif any(w in t for w in ["work", "job", "employment"]):
-            entities["purpose"] = "work"
-        if entities.get("purpose"):
-            print(f"[conversation] Purpose: {entities['purpose']}")
+        """Extract key entities from user input with context continuity.
 
-        # --- Reuse context if missing ---
-        for key in ["destination", "duration", "budget", "citizenship", "purpose"]:
-            if not entities.get(key) and self.context.get(key):
-                entities[key] = self.context[key]
-                print(f"[conversation] Reused {key} from context: {entities[key]}")
+        Always returns the same fixed key set (missing values are None / []),
+        so callers read each field once with .get and never probe for keys.
+        """
+        # Keyed on the stripped input: outer whitespace never affects a match, case
+        # does (names, passports). Copy: the cached dict and its list are shared.
+        entities = dict(_extract(user_input.strip()))
+        entities["interests"] = list(entities["interests"])
 
-        if not entities["interests"] and self.context.get("interests"):
-            entities["interests"] = self.context["interests"]
+        # --- Reuse context if missing ---
+        ctx = self.context
+        for key in _REUSED_KEYS:
+            if not entities[key] and (value := ctx.get(key)):
+                entities[key] = value
 
-        logger.info(f"Entities extracted: {entities}")
-        print(f"[conversation] Entities extracted: {entities}")
+        logger.debug("Entities extracted: %s", entities)
         return entities
 
     # ---------------- Context ----------------
+    def set_context(self, key: str, value: Any):
+        """Write a context entry; all context writes go through here."""
+        self.context[key] = value
+        self.safe_context[key] = value.value if key in ENUM_KEYS and isinstance(value, QueryType) else value
+        self.version += 1
+
     def update_context(self, user_input: str, query_type: QueryType, entities: Dict[str, Any]):
         """Update conversation context and keep continuity across turns."""
-        logger.info("Updating conversation context...")
-        print("[conversation] Updating context...")
-
         prev = self.context.get("current_topic")
         if prev:
-            self.context["previous_topic"] = prev
-            print(f"[conversation] Previous topic set: {prev}")
+            self.set_context("previous_topic", prev)
 
-        self.context["current_topic"] = query_type.value
+        self.set_context("current_topic", query_type.value)
         self.current_topic = query_type
-        print(f"[conversation] Current topic set: {query_type.value}")
 
         for k, v in entities.items():
             if v:
-                self.context[k] = v
-                print(f"[conversation] Stored entity {k}={v}")
+                self.set_context(k, v)
 
         if query_type == QueryType.ACCOMMODATION:
-            self.context["accommodation_intent"] = True
-            self.context["last_accommodation_query"] = user_input
+            self.set_context("accommodation_intent", True)
+            self.set_context("last_accommodation_query", user_input)
 
         # Persist to history
         self.history.append({"query": user_input, "type": query_type.value, "entities": entities})
 
-        logger.info(f"Context updated: {self.context}")
-        print(f"[conversation] Context updated: {self.context}")
+        logger.debug("Context updated: %s", self.context)
 
     # ---------------- Reset ----------------
     def reset(self):
         """Clear context and history (used by /assistant/reset and 'New Chat')."""
         logger.info("Resetting conversation context & history")
         self.context.clear()
+        self.safe_context.clear()
         self.current_topic = None
+        self.version += 1
         self.history.clear()
-        print("[conversation] Reset complete")
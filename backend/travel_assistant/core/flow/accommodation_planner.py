@@ -2,19 +2,28 @@
 import re
 from typing import Optional
 
+# Checked in this order, first hit wins (not first in the text).
+_TYPES = ("hotel", "hostel", "apartment", "resort", "guesthouse", "bnb", "motel", "boutique")
+_VIBES = ("luxury", "boutique", "business", "family", "romantic", "party", "quiet")
+
+# One union pattern per lexicon: a single scan reports every keyword present.
+# Callers pass lowercased text, so no pattern needs re.I.
+_TYPE_RE = re.compile(r"\b(" + "|".join(map(re.escape, _TYPES)) + r")s?\b")
+_ANY_VIBE_RE = re.compile(r"\b(don'?t care|don’t care|no preference|any|flexible)\b")
+_VIBE_RE = re.compile(r"\b(" + "|".join(map(re.escape, _VIBES)) + r")\b")
+
+def _first_in_order(pattern: "re.Pattern[str]", lexicon, text: str) -> Optional[str]:
+    found = set(pattern.findall(text))
+    return next((w for w in lexicon if w in found), None) if found else None
+
 class AccommodationPlanner:
     @staticmethod
     def parse_type(text: str) -> Optional[str]:
-        for t in ["hotel", "hostel", "apartment", "resort", "guesthouse", "bnb", "motel", "boutique"]:
-            if re.search(rf"\b{t}s?\b", text, re.I):
-                return "hotel" if t == "boutique" else t
-        return None
+        t = _first_in_order(_TYPE_RE, _TYPES, text)
+        return "hotel" if t == "boutique" else t
 
     @staticmethod
     def parse_vibe(text: str) -> Optional[str]:
-        if re.search(r"\b(don'?t care|don’t care|no preference|any|flexible)\b", text, re.I):
+        if _ANY_VIBE_RE.search(text):
             return "any"
-        for v in ["luxury", "boutique", "business", "family", "romantic", "party", "quiet"]:
-            if re.search(rf"\b{v}\b", text, re.I):
-                return v
-        return None
+        return _first_in_order(_VIBE_RE, _VIBES, text)
@@ -2,18 +2,22 @@
 import re
 from typing import Tuple, Optional
 
+# Callers pass lowercased text, so no pattern needs re.I.
+_UNLIMITED_RE = re.compile(r"\bunlimited\b|\bno\s*limit\b|\bno budget\b")
+_PRICE_RE = re.compile(r"(\$|€|£)?\s*(\d{2,5})\s*(usd|eur|gbp|dollars|euros|pounds)?\s*(per\s*night|/night)?")
+
 class BudgetInterpreter:
     @staticmethod
     def parse(text: str) -> Tuple[bool, Optional[float], Optional[str]]:
         """
         Returns: (unlimited, max_price_per_night, currency)
-        Detects "unlimited", else tries numbers + currency.
+        Detects "unlimited", else tries numbers + currency. `text` is lowercased.
         """
-        if re.search(r"\bunlimited\b|\bno\s*limit\b|\bno budget\b", text, re.I):
+        if _UNLIMITED_RE.search(text):
             return True, None, None
 
         # Simple price detection (extend as needed)
-        m = re.search(r"(\$|€|£)?\s*(\d{2,5})\s*(usd|eur|gbp|dollars|euros|pounds)?\s*(per\s*night|/night)?", text, re.I)
+        m = _PRICE_RE.search(text)
         if m:
             sym, amount, cur, _ = m.groups()
             amt = float(amount)
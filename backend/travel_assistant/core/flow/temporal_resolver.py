@@ -1,46 +1,57 @@
 # core/flow/temporal_resolver.py
 import re
+import time
 from datetime import datetime, timedelta, date
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from typing import Optional, Tuple
 
 IL_TZ = ZoneInfo("Asia/Jerusalem")
 
+# Callers pass lowercased text, so no pattern needs re.I.
+# One scan serves both reads: every "<n> <unit>" is a duration candidate, and
+# those led by "in" (days/weeks only) are also relative-start candidates.
+_TEMPORAL_RE = re.compile(
+    r"(?:\b(?P<rel>in)\s+)?\b(?P<qty>\d+)\s+(?P<unit>days?|nights?|weeks?)\b"
+)
+
+@lru_cache(maxsize=1)
+def _today(epoch_sec: int) -> date:
+    # Keyed on the whole second: a burst of turns shares one tz-aware lookup.
+    return datetime.fromtimestamp(epoch_sec, IL_TZ).date()
+
 class TemporalResolver:
     """
     Resolves phrases like:
       - "in 2 days from now" + "staying for 14 days"
       - "in 1 week" + "for 10 days"
-    into concrete start/end dates using Asia/Jerusalem.
+    into concrete start/end dates using Asia/Jerusalem. Expects lowercased text.
     """
 
     @staticmethod
-    def _extract_relative_days(text: str) -> Optional[int]:
-        # Examples: "in 2 days", "in 1 day from now", "in 2 weeks", etc.
-        m = re.search(r"\bin\s+(\d+)\s+(day|days|week|weeks)\b", text, re.I)
-        if not m: 
-            return None
-        qty = int(m.group(1))
-        unit = m.group(2).lower()
-        return qty * (7 if "week" in unit else 1)
+    def _extract_days(text: str) -> Tuple[Optional[int], Optional[int]]:
+        """(relative_days, duration_days) from the first matching phrase of each kind.
 
-    @staticmethod
-    def _extract_duration_days(text: str) -> Optional[int]:
-        m = re.search(r"\b(\d+)\s+(day|days|night|nights|week|weeks)\b", text, re.I)
-        if not m: 
-            return None
-        qty = int(m.group(1))
-        unit = m.group(2).lower()
-        if "week" in unit:
-            return qty * 7
-        # If "nights" provided, treat nights as days for hotel booking window
-        return qty
+        Examples: "in 2 days", "in 1 week from now", "for 10 nights". The
+        duration is the first "<n> <unit>" anywhere, even the one inside
+        "in 2 days". Nights count as days for the hotel booking window.
+        """
+        rel_days: Optional[int] = None
+        dur_days: Optional[int] = None
+        for m in _TEMPORAL_RE.finditer(text):
+            unit = m["unit"]
+            days = int(m["qty"]) * (7 if unit[0] == "w" else 1)
+            if dur_days is None:
+                dur_days = days
+            if m["rel"] and unit[0] != "n":
+                rel_days = days
+                break
+        return rel_days, dur_days
 
     @classmethod
     def resolve(cls, text: str) -> Tuple[Optional[date], Optional[date], Optional[int]]:
-        now = datetime.now(IL_TZ).date()
-        rel_days = cls._extract_relative_days(text)
-        dur_days = cls._extract_duration_days(text)
+        now = _today(int(time.time()))
+        rel_days, dur_days = cls._extract_days(text)
 
         start: Optional[date] = None
         end: Optional[date] = None
@@ -1,29 +1,81 @@
 # travel_assistant/core/prompt_engine.py
 import logging
-from typing import Dict
-from dataclasses import dataclass
+import string
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+class _SafeDict(dict):
+    """format_map mapping: a placeholder the caller didn't pass renders empty."""
+    def __missing__(self, key):
+        return ""
+
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
 @dataclass
 class PromptTemplate:
     system_prompt: str
     user_prompt: str
     chain_of_thought: bool = False
+    # (literal, field, format_spec, conversion) per placeholder; None when a
+    # field needs str.format's own lookup ({a.b}, {a[0]}, {0}, nested specs).
+    _parsed: Optional[List[Tuple[str, Optional[str], str, Optional[str]]]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Parse the placeholders once instead of on every render.
+        parsed = list(string.Formatter().parse(self.user_prompt))
+        plain = all(
+            name is None or (name.isidentifier() and "{" not in spec)
+            for _literal, name, spec, _conv in parsed
+        )
+        self._parsed = parsed if plain else None
+
+    def render(self, mapping: Mapping[str, Any]) -> str:
+        """Fill the user prompt like format_map; a placeholder the caller didn't pass renders empty."""
+        if self._parsed is None:
+            return self.user_prompt.format_map(_SafeDict(mapping))
+        out = []
+        for literal, name, spec, conv in self._parsed:
+            out.append(literal)
+            if name is not None:
+                value = mapping.get(name, "")
+                if conv:
+                    value = _CONVERSIONS[conv](value)
+                out.append(format(value, spec))
+        return "".join(out)
 
 
 class PromptEngine:
     """Engine for managing and optimizing prompts."""
+
+    # QueryType values that have a dedicated template under another name
+    QUERY_TEMPLATES = {
+        "destination": "destination_recommendation",
+        "packing": "packing_suggestions",
+        "attractions": "local_attractions",
+    }
+
+    # Per-message cap for stored history; long answers would otherwise bloat
+    # every prompt and response that carries the recent history.
+    HISTORY_MAX_CHARS = 600
+    HISTORY_MAX_MESSAGES = 10
+
     def __init__(self):
         logger.info(" Initializing PromptEngine...")
-        print("[prompt_engine] Initializing PromptEngine...")
         self.templates = self._initialize_templates()
-        self.conversation_history = []
+        self._renderers = self._compile_renderers()
+        # Bounded: the oldest message drops off in O(1) once the window is full.
+        self.conversation_history: Deque[Dict[str, str]] = deque(maxlen=self.HISTORY_MAX_MESSAGES)
+        self.version = 0  # bumped per history change
+        self._recent_cache = None  # ((version, max_messages), rendered history)
         logger.info(" PromptEngine ready with templates loaded")
-        print("[prompt_engine]  Templates loaded successfully")
 
     def _initialize_templates(self) -> Dict[str, PromptTemplate]:
-        print("[prompt_engine]  Loading default prompt templates...")
         return {
             "destination_recommendation": PromptTemplate(
                 system_prompt=(
@@ -108,37 +160,47 @@ class PromptEngine:
             ),
         }
 
-    def build_prompt(self, query_type: str, **kwargs) -> Dict[str, str]:
-        logger.info(f" Building prompt for query_type={query_type}")
-        print(f"[prompt_engine]  Building prompt for query_type={query_type}")
+    def _compile_renderers(self) -> Dict[str, Callable[[Mapping[str, Any]], Dict[str, Any]]]:
+        """One renderer per template name (and QueryType value), built once."""
+        def compile_template(template: PromptTemplate):
+            fill = template.render
+            system, cot = template.system_prompt, template.chain_of_thought
 
-        template = self.templates.get(query_type)
-        if not template:
-            logger.warning(f" Unknown query_type={query_type}, defaulting to destination_recommendation")
-            print(f"[prompt_engine]  Unknown type={query_type}, using default")
-            template = self.templates["destination_recommendation"]
+            def render(ctx: Mapping[str, Any]) -> Dict[str, Any]:
+                return {"system": system, "user": fill(ctx), "chain_of_thought": cot}
+            return render
 
-        formatted_user_prompt = template.user_prompt.format(**kwargs)
-        print(f"[prompt_engine]  Prompt built, length={len(formatted_user_prompt)}")
+        renderers = {name: compile_template(t) for name, t in self.templates.items()}
+        for query_type, name in self.QUERY_TEMPLATES.items():
+            renderers[query_type] = renderers[name]
+        return renderers
 
-        return {
-            "system": template.system_prompt,
-            "user": formatted_user_prompt,
-            "chain_of_thought": template.chain_of_thought,
-        }
+    def build_prompt(self, query_type: str, **kwargs) -> Dict[str, str]:
+        logger.debug(" Building prompt for query_type=%s", query_type)
+
+        render = self._renderers.get(query_type)
+        if not render:
+            logger.warning(" Unknown query_type=%s, defaulting to destination_recommendation", query_type)
+            render = self._renderers["destination_recommendation"]
+
+        return render(kwargs)
 
     def add_to_history(self, role: str, content: str):
-        print(f"[prompt_engine]  History updated: {role} says {content[:50]}...")
+        if len(content) > self.HISTORY_MAX_CHARS:
+            content = content[: self.HISTORY_MAX_CHARS - 1].rstrip() + "…"
         self.conversation_history.append({"role": role, "content": content})
-        if len(self.conversation_history) > 10:
-            print("[prompt_engine]  Trimming history to last 10 messages")
-            self.conversation_history = self.conversation_history[-10:]
+        self.version += 1
 
     def get_recent_history(self, max_messages: int = 5) -> str:
-        print(f"[prompt_engine]  Returning last {max_messages} history entries")
-        recent = self.conversation_history[-max_messages:] if self.conversation_history else []
-        history = "\n".join([f"{m['role']}: {m['content']}" for m in recent])
-        return (
+        key = (self.version, max_messages)
+        if self._recent_cache and self._recent_cache[0] == key:
+            return self._recent_cache[1]
+        history_len = len(self.conversation_history)
+        recent = islice(self.conversation_history, max(history_len - max_messages, 0), None)
+        history = "\n".join(f"{m['role']}: {m['content']}" for m in recent)
+        rendered = (
             "Conversation so far (use it to stay consistent and avoid repeating yourself):\n"
             f"{history}\n"
         )
+        self._recent_cache = (key, rendered)
+        return rendered
@@ -9,16 +9,10 @@ class AccommodationResponder(BaseResponder):
         acc_type = entities.get("accommodation_type")
 
         if hotels:
-            lines = []
-            for h in hotels[:5]:
-                extras = []
-                if h.get("rating"):
-                    extras.append(f"{h['rating']}/5")
-                if h.get("distance_km") is not None:
-                    extras.append(f"{h['distance_km']:.1f} km from center")
-                extra_str = f" — {', '.join(extras)}" if extras else ""
-                lines.append(f"• {h.get('name','Unnamed')} ({h.get('type','hotel')}){extra_str}")
-            hotel_list = "\n".join(lines)
+            hotel_list = "\n".join(
+                f"• {h.get('name','Unnamed')} ({h.get('type','hotel')}){self._extras(h)}"
+                for h in hotels[:5]
+            )
 
             return (
                 f"**Where to Stay in {destination}{f', {country}' if country else ''}{' ('+acc_type+')' if acc_type else ''}:**\n\n"
@@ -30,3 +24,14 @@ class AccommodationResponder(BaseResponder):
             "I can tailor recommendations — quick questions:\n"
             "• Budget range (per night)?\n• Preferred type (hotel, apartment, hostel, boutique)?\n• Travel dates?"
         )
+
+    @staticmethod
+    def _extras(h) -> str:
+        rating, distance = h.get("rating"), h.get("distance_km")
+        if rating and distance is not None:
+            return f" — {rating}/5, {distance:.1f} km from center"
+        if rating:
+            return f" — {rating}/5"
+        if distance is not None:
+            return f" — {distance:.1f} km from center"
+        return ""
@@ -39,7 +39,7 @@ class BestTimeResponder(BaseResponder):
     async def respond(self, entities: Dict[str, Any], external: Dict[str, Any], context: Dict[str, Any]) -> str:
         destination = entities.get("destination") or context.get("destination") or "your destination"
         interests = set((entities.get("interests") or []) + (context.get("interests") or []))
-        climate_info = external.get("climate_info")  # from WeatherService.get_climate_summary
+        climate_info = external.get("climate_info")  # from WeatherService.get_climate_summary_async
         coords = external.get("coords")  # {"lat":..,"lon":..}
 
         # Hard-coded high-signal knowledge: Bali + Surfing
@@ -48,7 +48,7 @@ class SafetyResponder(BaseResponder):
     async def respond(self, entities: Dict[str, Any], external: Dict[str, Any], context: Dict[str, Any]) -> str:
         destination = self._norm(entities.get("destination") or context.get("destination") or "your destination")
         country = external.get("country") or {}
-        climate = external.get("climate_info")  # from WeatherService.get_climate_summary
+        climate = external.get("climate_info")  # from WeatherService.get_climate_summary_async
         region_hint = self._region_hint(country)
         climate_tiplist = self._climate_watchouts(climate)
 
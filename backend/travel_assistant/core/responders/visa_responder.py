@@ -1,7 +1,7 @@
 # travel_assistant/core/responders/visa_responder.py
 from __future__ import annotations
-from typing import Dict, Any, Optional
-from ..conversation import QueryType
+from typing import Dict, Any
+from ...utils.helpers import estimate_days
 
 class VisaResponder:
     """
@@ -18,12 +18,10 @@ class VisaResponder:
         purpose = entities.get("purpose") or context.get("purpose") or "tourism"
 
         # Normalize a basic stay-days estimate
-        stay_days = None
-        if entities.get("duration"):
-            stay_days = self._estimate_days(entities["duration"])
+        stay_days = estimate_days(entities.get("duration"))
 
         # If not clearly Thailand, nudge
-        if "thailand" not in destination and destination.lower() not in ("bangkok", "phuket", "chiang mai"):
+        if not self.visa_service.is_thailand(destination):
             return (
                 "For visa advice I need 2 basics:\n"
                 "• **Destination country** (e.g., Thailand)\n"
@@ -41,7 +39,7 @@ class VisaResponder:
         # Prefer pre-fetched data in external; otherwise compute now
         advice = external.get("visa_th")
         if not advice:
-            advice = self.visa_service.get_thailand_advice(
+            advice = self.visa_service.get_thailand_advice_cached(
                 passport_country=citizenship,
                 stay_length_days=stay_days,
                 purpose=purpose,
@@ -84,18 +82,3 @@ class VisaResponder:
             lines.append(f"\n_{advice['disclaimer']}_")
 
         return "\n".join(lines)
-
-    def _estimate_days(self, duration: str) -> Optional[int]:
-        d = duration.lower()
-        try:
-            if "day" in d:
-                for tok in d.replace("-", " ").split():
-                    if tok.isdigit():
-                        return int(tok)
-            if "week" in d:
-                for tok in d.replace("-", " ").split():
-                    if tok.isdigit():
-                        return int(tok) * 7
-        except Exception:
-            pass
-        return None
@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, Optional, Dict, Any
+import orjson
 
 from travel_assistant.core.assistant import TravelAssistant
 from travel_assistant.utils.helpers import format_response
@@ -20,7 +22,7 @@ class QueryResponse(BaseModel):
 
 # ------------------ Endpoints ------------------
 @router.post("/ask", response_model=QueryResponse)
-async def ask_travel_assistant(request: QueryRequest) -> QueryResponse:
+async def ask_travel_assistant(request: QueryRequest) -> Dict[str, Any]:
     """
     Main endpoint to ask the travel assistant a question.
     Returns:
@@ -33,15 +35,36 @@ async def ask_travel_assistant(request: QueryRequest) -> QueryResponse:
 
         formatted_answer = format_response(raw_result.get("answer", ""))
 
-        return QueryResponse(
-            answer=formatted_answer,
-            followup=raw_result.get("followup"),
-            context=raw_result.get("context", {})
-        )
+        # Plain dict: response_model validates it once on the way out, instead
+        # of validating a QueryResponse here and again during serialization.
+        return {
+            "answer": formatted_answer,
+            "followup": raw_result.get("followup"),
+            "context": raw_result.get("context", {}),
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Assistant error: {str(e)}")
 
 
+@router.post("/ask/stream")
+async def ask_travel_assistant_stream(request: QueryRequest) -> StreamingResponse:
+    """
+    Streaming variant of /ask, as Server-Sent Events.
+    Emits {"delta": "..."} events while the answer is generated, then one final
+    event with answer (formatted, authoritative), followup and context.
+    """
+    async def events() -> AsyncIterator[bytes]:
+        async for event in assistant.generate_response_stream(request.text):
+            if "delta" not in event:
+                event = {
+                    "answer": format_response(event.get("answer", "")),
+                    "followup": event.get("followup"),
+                    "context": event.get("context", {}),
+                }
+            yield b"data: " + orjson.dumps(event) + b"\n\n"
+
+    # text/event-stream is left alone by GZipMiddleware, so events aren't held back.
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
 @router.post("/reset")
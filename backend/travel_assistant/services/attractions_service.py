@@ -1,3 +1,4 @@
+import orjson
 import requests
 import logging
 from typing import List, Dict, Any
@@ -12,8 +13,7 @@ class AttractionsService:
         logger.debug("AttractionsService initialized")
 
     def get_attractions(self, lat: float, lon: float, radius: int = 5000, limit: int = 10) -> List[Dict[str, Any]]:
-        logger.info(f" Fetching attractions near {lat},{lon}")
-        print(f"[attractions_service]  Attractions lookup for {lat},{lon}")
+        logger.info(" Fetching attractions near %s,%s", lat, lon)
 
         query = f"""
         [out:json];
@@ -30,7 +30,7 @@ class AttractionsService:
         try:
             resp = requests.post(self.base_url, data={"data": query}, timeout=20)
             resp.raise_for_status()
-            elements = resp.json().get("elements", [])
+            elements = orjson.loads(resp.content).get("elements", [])
 
             return [
                 {
@@ -47,8 +47,7 @@ class AttractionsService:
                 for el in elements[:limit]
             ]
         except Exception as e:
-            logger.error(f" Attractions API error: {e}", exc_info=True)
-            print(f"[attractions_service]  Failed to fetch attractions: {e}")
+            logger.error(" Attractions API error: %s", e, exc_info=True)
             return []
 
     def get_attractions_by_country_code(self, iso2: str, limit: int = 20) -> List[Dict[str, Any]]:
@@ -73,7 +72,7 @@ class AttractionsService:
         try:
             resp = requests.post(self.base_url, data={"data": query}, timeout=30)
             resp.raise_for_status()
-            elements = resp.json().get("elements", [])
+            elements = orjson.loads(resp.content).get("elements", [])
             out = []
             for el in elements[:limit]:
                 tags = el.get("tags", {})
@@ -87,5 +86,5 @@ class AttractionsService:
                 })
             return out
         except Exception as e:
-            logger.error(f" Attractions-by-country API error: {e}", exc_info=True)
+            logger.error(" Attractions-by-country API error: %s", e, exc_info=True)
             return []
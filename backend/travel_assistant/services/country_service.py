@@ -1,15 +1,19 @@
-import requests
+import orjson
 import logging
 from typing import Optional, Dict, Any
 
-from ..utils.helpers import geocode_location, reverse_geocode_country
+from ..utils.helpers import reverse_geocode_country_async
+
+from ..utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
 class CountryService:
+    FIELDS = "name,capital,region,subregion,population,languages,currencies,timezones"
+
     def __init__(self):
         self.base_url = "https://restcountries.com/v3.1"
-        logger.debug(f"CountryService initialized with base_url={self.base_url}")
+        logger.debug("CountryService initialized with base_url=%s", self.base_url)
 
     def _extract_result(self, payload: Any) -> Optional[Dict[str, Any]]:
         if isinstance(payload, list) and payload:
@@ -33,41 +37,41 @@ class CountryService:
             "timezones": data.get("timezones", []),
         }
 
-    def get_country_info(self, place_name: str) -> Optional[Dict[str, Any]]:
-        logger.info(f" Fetching country info for: {place_name}")
-        print(f"[country_service]  Looking up information for: {place_name}")
+    async def get_country_info_async(
+        self, place_name: str, coords: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Country summary for a place, over the shared async client.
+
+        `coords` is the caller's geocode result for `place_name`, if it has one;
+        without it the place name is looked up as a country, then a capital.
+        """
+        logger.info(" Fetching country info for: %s", place_name)
+        client = get_http_client()
 
         try:
             resolved_country = None
-            coords = geocode_location(place_name)
             if coords:
                 resolved_country = coords.get("country")
                 if not resolved_country:
-                    rev = reverse_geocode_country(coords["lat"], coords["lon"])
+                    rev = await reverse_geocode_country_async(client, coords["lat"], coords["lon"])
                     resolved_country = rev.get("country") if rev else None
 
-            params = {"fields": "name,capital,region,subregion,population,languages,currencies,timezones"}
-
-            if resolved_country:
-                resp = requests.get(f"{self.base_url}/name/{resolved_country}", params=params, timeout=10)
-            else:
-                resp = requests.get(f"{self.base_url}/name/{place_name}", params=params, timeout=10)
+            params = {"fields": self.FIELDS}
 
+            resp = await client.get(f"{self.base_url}/name/{resolved_country or place_name}", params=params, timeout=10)
             if resp.status_code == 404:
-                resp = requests.get(f"{self.base_url}/capital/{place_name}", params=params, timeout=10)
+                resp = await client.get(f"{self.base_url}/capital/{place_name}", params=params, timeout=10)
 
             resp.raise_for_status()
-            data = self._extract_result(resp.json())
+            data = self._extract_result(orjson.loads(resp.content))
             if not data:
                 logger.warning("Country data empty/unexpected format")
                 return None
 
             result = self._build_country_summary(data)
-            logger.info(f" Country info retrieved successfully for {result.get('name')}")
-            print(f"[country_service]  Country info ready: {result['capital']}, {result['region']}")
+            logger.info(" Country info retrieved successfully for %s", result.get('name'))
             return result
 
         except Exception as e:
-            logger.error(f" Country API error for {place_name}: {e}", exc_info=True)
-            print(f"[country_service]  Failed to fetch country info for {place_name}: {e}")
+            logger.error(" Country API error for %s: %s", place_name, e, exc_info=True)
             return None
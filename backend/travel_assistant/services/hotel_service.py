@@ -1,8 +1,10 @@
 # travel_assistant/services/hotel_service.py
-import requests
+import orjson
 import logging
 from typing import List, Dict, Any
 
+from ..utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 class HotelService:
@@ -28,42 +30,46 @@ class HotelService:
         out body {limit};
         """
 
-    def get_hotels_nearby(
+    async def get_hotels_nearby_async(
         self, lat: float, lon: float, radius: int = 3000, limit: int = 5
     ) -> List[Dict[str, Any]]:
-        logger.info(f"Fetching hotels near {lat},{lon}")
-        print(f"[hotel_service] Hotels lookup for {lat},{lon}")
+        logger.info("Fetching hotels near %s,%s", lat, lon)
 
+        client = get_http_client()
         # Retry with multiple mirrors and decreasing radius
         radii = [radius, int(radius * 0.5), int(radius * 0.25)]
         for base_url in self.base_urls:
             for r in radii:
                 query = self._build_query(lat, lon, r, limit)
                 try:
-                    resp = requests.post(base_url, data={"data": query}, timeout=20)
+                    resp = await client.post(base_url, data={"data": query}, timeout=20)
                     resp.raise_for_status()
-                    elements = resp.json().get("elements", [])
+                    elements = orjson.loads(resp.content).get("elements", [])
                     if not elements:
                         continue
 
-                    hotels = [
-                        {
-                            "name": el.get("tags", {}).get("name", "Unnamed Hotel"),
-                            "lat": el.get("lat"),
-                            "lon": el.get("lon"),
-                            "type": el.get("tags", {}).get("tourism", "hotel"),
-                        }
-                        for el in elements[:limit]
-                    ]
-                    logger.info(f"Found {len(hotels)} hotels via {base_url} with radius={r}")
-                    print(f"[hotel_service] Found {len(hotels)} hotels near {lat},{lon}")
+                    hotels = self._parse_elements(elements, limit)
+                    logger.info("Found %s hotels via %s with radius=%s", len(hotels), base_url, r)
                     return hotels
                 except Exception as e:
-                    logger.warning(f"Hotel API error on {base_url} (radius={r}): {e}")
+                    logger.warning("Hotel API error on %s (radius=%s): %s", base_url, r, e)
 
         # If all fails
         logger.error("All hotel API attempts failed")
-        print("[hotel_service] Failed to fetch hotels from all mirrors")
+        return self._unavailable(lat, lon)
+
+    def _parse_elements(self, elements: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": el.get("tags", {}).get("name", "Unnamed Hotel"),
+                "lat": el.get("lat"),
+                "lon": el.get("lon"),
+                "type": el.get("tags", {}).get("tourism", "hotel"),
+            }
+            for el in elements[:limit]
+        ]
+
+    def _unavailable(self, lat: float, lon: float) -> List[Dict[str, Any]]:
         return [
             {
                 "name": "Hotel data temporarily unavailable",
@@ -1,3 +1,4 @@
+import orjson
 import requests
 import logging
 from typing import List, Dict, Any
@@ -12,8 +13,7 @@ class TransportService:
         logger.debug("TransportService initialized")
 
     def get_transport_stops(self, lat: float, lon: float, radius: int = 1000) -> List[Dict[str, Any]]:
-        logger.info(f" Fetching transport stops near {lat},{lon}")
-        print(f"[transport_service]  Transport stops lookup for {lat},{lon}")
+        logger.info(" Fetching transport stops near %s,%s", lat, lon)
 
         query = f"""
         [out:json];
@@ -28,7 +28,7 @@ class TransportService:
         try:
             resp = requests.post(self.base_url, data={"data": query}, timeout=15)
             resp.raise_for_status()
-            elements = resp.json().get("elements", [])
+            elements = orjson.loads(resp.content).get("elements", [])
             stops = [
                 {
                     "name": el.get("tags", {}).get("name", "Unnamed Stop"),
@@ -38,9 +38,8 @@ class TransportService:
                 }
                 for el in elements
             ]
-            logger.info(f" Found {len(stops)} stops")
+            logger.info(" Found %s stops", len(stops))
             return stops
         except Exception as e:
-            logger.error(f" Transport API error: {e}", exc_info=True)
-            print(f"[transport_service]  Failed to fetch transport info: {e}")
+            logger.error(" Transport API error: %s", e, exc_info=True)
             return []
@@ -1,7 +1,11 @@
 # travel_assistant/services/visa_service.py
 from __future__ import annotations
 from typing import Optional, Dict, Any, List
+import functools
 import logging
+import re
+
+from ..utils.helpers import estimate_days
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +31,36 @@ class VisaService:
         "romania", "bulgaria",
     }
 
+    # Destinations (lowercased) that route to the Thailand rules above
+    THAILAND_DESTINATIONS = frozenset({
+        "thailand", "bangkok", "phuket", "chiang mai",
+    })
+    # One pass over the input, also catching "Bangkok, Thailand" or "Phuket Town"
+    _THAILAND_RE = re.compile(
+        r"\b(?:" + "|".join(sorted(map(re.escape, THAILAND_DESTINATIONS), key=len, reverse=True)) + r")\b",
+        re.I,
+    )
+
+    def __init__(self):
+        # Advice is a pure function of its arguments; repeat turns reuse it.
+        self._thailand_advice = functools.lru_cache(maxsize=1024)(self.get_thailand_advice)
+
+    def get_thailand_advice_cached(
+        self,
+        passport_country: Optional[str],
+        stay_length_days: Optional[int],
+        purpose: Optional[str] = "tourism",
+    ) -> Optional[Dict[str, Any]]:
+        """get_thailand_advice, memoized; each caller gets its own copy to edit."""
+        advice = self._thailand_advice(passport_country, stay_length_days, purpose)
+        if advice is None:
+            return None
+        # Values are strings/ints except the three lists: copy those, share the rest.
+        return {k: list(v) if isinstance(v, list) else v for k, v in advice.items()}
+
+    def is_thailand(self, place: Optional[str]) -> bool:
+        return bool(place) and self._THAILAND_RE.search(place) is not None
+
     def _normalize(self, s: Optional[str]) -> str:
         return (s or "").strip().lower()
 
@@ -34,22 +68,7 @@ class VisaService:
         """
         Convert simple duration strings like '7 days', '1 week', '2 weeks' to days.
         """
-        if not duration:
-            return None
-        d = duration.lower().strip()
-        try:
-            if "day" in d:
-                # e.g., "7 days"
-                for tok in d.split():
-                    if tok.isdigit():
-                        return int(tok)
-            if "week" in d:
-                for tok in d.split():
-                    if tok.isdigit():
-                        return int(tok) * 7
-        except Exception:
-            pass
-        return None
+        return estimate_days(duration)
 
     def get_thailand_advice(
         self,
@@ -65,7 +84,7 @@ class VisaService:
         purpose = self._normalize(purpose) or "tourism"
         stay_days = stay_length_days
 
-        logger.info(f"[visa] Thailand visa check: passport={passport_country}, stay_days={stay_days}, purpose={purpose}")
+        logger.info("[visa] Thailand visa check: passport=%s, stay_days=%s, purpose=%s", passport_country, stay_days, purpose)
 
         # Base document expectations (common requirements)
         base_docs: List[str] = [
@@ -1,9 +1,13 @@
 # travel_assistant/services/weather_service.py
-from datetime import time
+import asyncio
+import httpx
+import orjson
 import requests
 import logging
 from typing import Optional, Dict, Any, List
 
+from ..utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 _CODE_MAP = {
@@ -35,26 +39,26 @@ class WeatherService:
         ]
 
     # ---------------- HELPER ----------------
-    def _fetch_with_retries(self, url: str, params: Dict[str, Any], max_retries: int = 3) -> Optional[Dict[str, Any]]:
+    async def _fetch_with_retries_async(self, url: str, params: Dict[str, Any], max_retries: int = 3) -> Optional[Dict[str, Any]]:
+        client = get_http_client()
         timeout = 10
         for attempt in range(max_retries):
             try:
-                resp = requests.get(url, params=params, timeout=timeout)
+                resp = await client.get(url, params=params, timeout=timeout)
                 resp.raise_for_status()
-                return resp.json()
-            except requests.exceptions.Timeout:
-                logger.warning(f" Weather API timeout (attempt {attempt+1}/{max_retries}, url={url})")
-                time.sleep(1.5 * (attempt + 1))  # backoff
+                return orjson.loads(resp.content)
+            except httpx.TimeoutException:
+                logger.warning(" Weather API timeout (attempt %s/%s, url=%s)", attempt+1, max_retries, url)
+                await asyncio.sleep(1.5 * (attempt + 1))  # backoff
                 timeout += 5
             except Exception as e:
-                logger.warning(f" Weather API error on {url}: {e}")
+                logger.warning(" Weather API error on %s: %s", url, e)
                 break
         return None
 
     # ---------------- DAILY FORECAST ----------------
-    def get_weather_forecast(self, latitude: float, longitude: float, days: int = 7) -> Optional[Dict[str, Any]]:
-        logger.info(f" Fetching daily forecast lat={latitude}, lon={longitude}, days={days}")
-        params = {
+    def _forecast_params(self, latitude: float, longitude: float, days: int) -> Dict[str, Any]:
+        return {
             "latitude": latitude,
             "longitude": longitude,
             "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,weathercode",
@@ -63,33 +67,27 @@ class WeatherService:
             "timezone": "auto"
         }
 
-        for base_url in self.base_urls:
-            data = self._fetch_with_retries(base_url, params)
-            if not data:
-                continue
-
-            try:
-                forecast = [
-                    {
-                        "date": data["daily"]["time"][i],
-                        "max_temp": data["daily"]["temperature_2m_max"][i],
-                        "min_temp": data["daily"]["temperature_2m_min"][i],
-                        "precipitation": data["daily"]["precipitation_sum"][i],
-                        "weathercode": data["daily"]["weathercode"][i],
-                        "condition": _code_text(data["daily"]["weathercode"][i]),
-                    }
-                    for i in range(len(data["daily"]["time"]))
-                ]
-                return {
-                    "latitude": data["latitude"],
-                    "longitude": data["longitude"],
-                    "current_temp": data["current_weather"]["temperature"],
-                    "condition": _code_text(data["current_weather"]["weathercode"]),
-                    "forecast": forecast
-                }
-            except Exception as e:
-                logger.error(f" Failed to parse weather response from {base_url}: {e}", exc_info=True)
+    def _parse_forecast(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        forecast = [
+            {
+                "date": data["daily"]["time"][i],
+                "max_temp": data["daily"]["temperature_2m_max"][i],
+                "min_temp": data["daily"]["temperature_2m_min"][i],
+                "precipitation": data["daily"]["precipitation_sum"][i],
+                "weathercode": data["daily"]["weathercode"][i],
+                "condition": _code_text(data["daily"]["weathercode"][i]),
+            }
+            for i in range(len(data["daily"]["time"]))
+        ]
+        return {
+            "latitude": data["latitude"],
+            "longitude": data["longitude"],
+            "current_temp": data["current_weather"]["temperature"],
+            "condition": _code_text(data["current_weather"]["weathercode"]),
+            "forecast": forecast
+        }
 
+    def _unavailable(self, latitude: float, longitude: float) -> Dict[str, Any]:
         # Fallback if all APIs failed
         logger.error("All weather API attempts failed")
         return {
@@ -100,10 +98,25 @@ class WeatherService:
             "forecast": []
         }
 
+    async def get_weather_forecast_async(self, latitude: float, longitude: float, days: int = 7) -> Optional[Dict[str, Any]]:
+        logger.info(" Fetching daily forecast lat=%s, lon=%s, days=%s", latitude, longitude, days)
+        params = self._forecast_params(latitude, longitude, days)
+
+        for base_url in self.base_urls:
+            data = await self._fetch_with_retries_async(base_url, params)
+            if not data:
+                continue
+
+            try:
+                return self._parse_forecast(data)
+            except Exception as e:
+                logger.error(" Failed to parse weather response from %s: %s", base_url, e, exc_info=True)
+
+        return self._unavailable(latitude, longitude)
+
     # ---------------- HOURLY FORECAST ----------------
     def get_hourly_forecast(self, latitude: float, longitude: float, hours: int = 24) -> Optional[List[Dict[str, Any]]]:
-        logger.info(f" Fetching hourly forecast for next {hours}h")
-        print(f"[weather_service]  Hourly forecast for {hours} hours")
+        logger.info(" Fetching hourly forecast for next %sh", hours)
         try:
             params = {
                 "latitude": latitude,
@@ -114,7 +127,7 @@ class WeatherService:
             }
             resp = requests.get(self.base_url, params=params, timeout=12)
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
             hourly = [
                 {
                     "time": data["hourly"]["time"][i],
@@ -127,14 +140,12 @@ class WeatherService:
             ]
             return hourly
         except Exception as e:
-            logger.error(f" Hourly forecast error: {e}", exc_info=True)
-            print(f"[weather_service]  Hourly forecast error: {e}")
+            logger.error(" Hourly forecast error: %s", e, exc_info=True)
             return None
 
     # ---------------- AIR QUALITY ----------------
     def get_air_quality(self, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
         logger.info(" Fetching air quality (AQI)")
-        print("[weather_service]  Requesting AQI data")
         try:
             url = "https://air-quality-api.open-meteo.com/v1/air-quality"
             params = {
@@ -145,15 +156,16 @@ class WeatherService:
             }
             resp = requests.get(url, params=params, timeout=12)
             resp.raise_for_status()
-            return resp.json()
+            return orjson.loads(resp.content)
         except Exception as e:
-            logger.error(f" Air quality error: {e}", exc_info=True)
-            print(f"[weather_service]  Air quality error: {e}")
+            logger.error(" Air quality error: %s", e, exc_info=True)
             return None
 
     # ---------------- CLIMATE SUMMARY ----------------
-    def get_climate_summary(self, latitude: float, longitude: float) -> Optional[str]:
-        f = self.get_weather_forecast(latitude, longitude)
+    async def get_climate_summary_async(self, latitude: float, longitude: float) -> Optional[str]:
+        return self._summarize(await self.get_weather_forecast_async(latitude, longitude))
+
+    def _summarize(self, f: Optional[Dict[str, Any]]) -> Optional[str]:
         if not f:
             return None
         temps = [d['max_temp'] for d in f['forecast']]
@@ -172,7 +184,7 @@ class WeatherService:
         return summary
 
     # ---------------- BEST TRAVEL DAY ----------------
-    def get_best_travel_day(self, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+    async def get_best_travel_day_async(self, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
         """
         Pick the 'nicest' day in the forecast for travel.
         Criteria:
@@ -180,7 +192,7 @@ class WeatherService:
         - Low precipitation (rain penalized heavily)
         Returns the best day's data + natural language explanation.
         """
-        forecast_data = self.get_weather_forecast(latitude, longitude, days=7)
+        forecast_data = await self.get_weather_forecast_async(latitude, longitude, days=7)
         if not forecast_data:
             return None
 
@@ -230,8 +242,7 @@ class WeatherService:
 
             best_day["advice"] = explanation
 
-            logger.info(f" Best travel day selected: {explanation}")
-            print(f"[weather_service]  Best travel day: {explanation}")
+            logger.info(" Best travel day selected: %s", explanation)
             return best_day
 
         return None
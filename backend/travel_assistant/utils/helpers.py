@@ -1,6 +1,8 @@
 # travel_assistant/utils/helpers.py
 import json
-import requests
+import re
+import httpx
+import orjson
 import logging
 from typing import Optional, Dict, Any
 
@@ -9,42 +11,59 @@ logger = logging.getLogger(__name__)
 
 
 
-def geocode_location(query: str):
-    """Forward geocode a place name and return lat/lon + country when available."""
-    logger.info(f" Geocoding request for city: {query}")
-    print(f"[helpers]  Looking up coordinates for: {query}")
+GEOCODE_URL = "https://geocoding-api.open-meteo.com/v1/search"
+REVERSE_GEOCODE_URL = "https://nominatim.openstreetmap.org/reverse"
+REVERSE_GEOCODE_HEADERS = {"User-Agent": "travel-assistant/1.0 (contact: you@example.com)"}
+
+
+def _geocode_params(query: str) -> Dict[str, Any]:
+    return {"name": query, "count": 1, "language": "en", "format": "json"}
+
+
+def _parse_geocode(js: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not js.get("results"):
+        return None
+    res = js["results"][0]
+    return {
+        "lat": res["latitude"],
+        "lon": res["longitude"],
+        "name": res.get("name"),
+        "country": res.get("country"),           #  new
+        "country_code": res.get("country_code"), #  new (ISO-2)
+    }
+
 
+async def geocode_location_async(client: httpx.AsyncClient, query: str):
+    """Forward geocode a place name and return lat/lon + country when available."""
+    logger.info(" Geocoding request for city: %s", query)
     try:
-        r = requests.get(
-            "https://geocoding-api.open-meteo.com/v1/search",
-            params={"name": query, "count": 1, "language": "en", "format": "json"},
-            timeout=10,
-        )
+        r = await client.get(GEOCODE_URL, params=_geocode_params(query), timeout=10)
         r.raise_for_status()
-        js = r.json()
-        if js.get("results"):
-            res = js["results"][0]
-            data = {
-                "lat": res["latitude"],
-                "lon": res["longitude"],
-                "name": res.get("name"),
-                "country": res.get("country"),           #  new
-                "country_code": res.get("country_code"), #  new (ISO-2)
-            }
-            logger.info(f" Geocode success: {query} → {data}")
-            print(f"[helpers]  Found coordinates for {query}: {data}")
-            return data
-        return None
+        data = _parse_geocode(orjson.loads(r.content))
+        if data:
+            logger.info(" Geocode success: %s → %s", query, data)
+        return data
     except Exception as e:
-        logger.error(f" Geocode error for {query}: {e}", exc_info=True)
+        logger.error(" Geocode error for %s: %s", query, e, exc_info=True)
         return None
 
 
 
+# "7 days", "2-weeks", "10day" -> (count, unit)
+_DURATION_DAYS = re.compile(r"(\d+)\s*-?\s*(day|week)s?", re.I)
+
+
+def estimate_days(duration: Optional[str]) -> Optional[int]:
+    """Convert duration strings like '7 days', '1 week', '2-weeks' to days."""
+    m = _DURATION_DAYS.search(duration or "")
+    if not m:
+        return None
+    return int(m.group(1)) * (7 if m.group(2).lower() == "week" else 1)
+
+
 def format_response(response: str) -> str:
     """Format LLM response for better readability"""
     logger.debug("Formatting LLM response")
-    print("[helpers]  Formatting LLM response")
 
     # Clean up common LLM artifacts
     response = response.replace("\\n", "\n").strip()
@@ -59,14 +78,13 @@ def format_response(response: str) -> str:
             formatted_paragraphs.append(paragraph)
 
     formatted = '\n\n'.join(formatted_paragraphs)
-    logger.debug(f"Formatted response length: {len(formatted)}")
+    logger.debug("Formatted response length: %s", len(formatted))
     return formatted
 
 
 def validate_travel_data(data: Dict[str, Any]) -> bool:
     """Validate travel-related data"""
-    logger.debug(f"Validating travel data: keys={list(data.keys())}")
-    print("[helpers]  Validating travel data")
+    logger.debug("Validating travel data: keys=%s", list(data.keys()))
     required_fields = {
         'destination_recommendation': ['interests'],
         'packing_suggestions': ['destination'],
@@ -78,46 +96,49 @@ def validate_travel_data(data: Dict[str, Any]) -> bool:
 
 def save_conversation(conversation_data: Dict[str, Any], filename: str):
     """Save conversation to file"""
-    logger.info(f" Saving conversation to {filename}")
-    print(f"[helpers]  Saving conversation to {filename}")
+    logger.info(" Saving conversation to %s", filename)
     try:
         with open(filename, 'w') as f:
             json.dump(conversation_data, f, indent=2)
         logger.info(" Conversation saved successfully")
     except Exception as e:
-        logger.error(f" Failed to save conversation: {e}", exc_info=True)
-        print(f"[helpers]  Failed to save conversation: {e}")
+        logger.error(" Failed to save conversation: %s", e, exc_info=True)
 
 
 def load_conversation(filename: str) -> Dict[str, Any]:
     """Load conversation from file"""
-    logger.info(f" Loading conversation from {filename}")
-    print(f"[helpers]  Loading conversation from {filename}")
+    logger.info(" Loading conversation from %s", filename)
     try:
         with open(filename, 'r') as f:
             data = json.load(f)
         logger.info(" Conversation loaded successfully")
         return data
     except Exception as e:
-        logger.error(f" Failed to load conversation: {e}", exc_info=True)
-        print(f"[helpers]  Failed to load conversation: {e}")
+        logger.error(" Failed to load conversation: %s", e, exc_info=True)
         return {}
 
 
-def reverse_geocode_country(lat: float, lon: float):
+def _reverse_geocode_params(lat: float, lon: float) -> Dict[str, Any]:
+    return {"format": "jsonv2", "lat": lat, "lon": lon, "zoom": 5, "addressdetails": 1}
+
+
+def _parse_reverse_geocode(js: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    addr = js.get("address", {}) or {}
+    country = addr.get("country")
+    code = addr.get("country_code")
+    return {"country": country, "country_code": code.upper() if code else None} if country else None
+
+
+async def reverse_geocode_country_async(client: httpx.AsyncClient, lat: float, lon: float):
     """Reverse geocode to country and ISO code."""
     try:
-        r = requests.get(
-            "https://nominatim.openstreetmap.org/reverse",
-            params={"format": "jsonv2", "lat": lat, "lon": lon, "zoom": 5, "addressdetails": 1},
-            headers={"User-Agent": "travel-assistant/1.0 (contact: you@example.com)"},
+        r = await client.get(
+            REVERSE_GEOCODE_URL,
+            params=_reverse_geocode_params(lat, lon),
+            headers=REVERSE_GEOCODE_HEADERS,
             timeout=10,
         )
         r.raise_for_status()
-        js = r.json()
-        addr = js.get("address", {}) or {}
-        country = addr.get("country")
-        code = addr.get("country_code")
-        return {"country": country, "country_code": code.upper() if code else None} if country else None
+        return _parse_reverse_geocode(orjson.loads(r.content))
     except Exception:
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,32 @@
+# travel_assistant/utils/http_client.py
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# One pooled client per process, shared by every assistant and service so
+# keep-alive connections survive across instances and turns.
+_GLOBAL_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide async client, creating it on first use."""
+    global _GLOBAL_CLIENT
+    if _GLOBAL_CLIENT is None or _GLOBAL_CLIENT.is_closed:
+        # HTTP/2 multiplexes concurrent lookups to the same host over one connection.
+        # Idle connections live 5 min so the gaps between a user's turns don't
+        # force a fresh TCP/TLS handshake.
+        limits = httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=300)
+        _GLOBAL_CLIENT = httpx.AsyncClient(timeout=httpx.Timeout(20.0, connect=5.0), limits=limits, http2=True)
+        logger.debug("Shared HTTP client created")
+    return _GLOBAL_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared client (app shutdown / end of a CLI session)."""
+    global _GLOBAL_CLIENT
+    if _GLOBAL_CLIENT is not None:
+        await _GLOBAL_CLIENT.aclose()
+        _GLOBAL_CLIENT = None